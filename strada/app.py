@@ -12,12 +12,20 @@ work with terminal commands.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import io
+import os
+import shutil
 import tempfile
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import streamlit as st
 import pandas as pd
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Page config
@@ -47,10 +55,140 @@ st.markdown(
 #  Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-@st.cache_data(show_spinner="Loading CSV…")
+def _upload_digest(uploaded_file) -> str:
+    """Content hash of an uploaded file, computed once per upload.
+
+    Hashes the upload's buffer in place (no copy) and is used as the cache
+    key for uploads, instead of Streamlit's default pickling of the file.
+    """
+    key = f"_digest_{uploaded_file.file_id}"
+    if key not in st.session_state:
+        st.session_state[key] = hashlib.blake2b(
+            uploaded_file.getbuffer(), digest_size=16
+        ).hexdigest()
+    return st.session_state[key]
+
+
+@st.cache_resource
+def _private_dir() -> Path:
+    """Directory for files derived from uploads, private to this process.
+
+    Created once per server process with owner-only permissions and
+    removed when the process exits, so uploaded crash data is never left
+    in the shared temp directory.
+    """
+    path = Path(tempfile.mkdtemp(prefix="strada-"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+@st.cache_data(show_spinner="Loading CSV…", hash_funcs={UploadedFile: _upload_digest})
 def _load_df(uploaded_file) -> pd.DataFrame:
-    """Read an uploaded CSV into a DataFrame."""
-    return pd.read_csv(uploaded_file, encoding="utf-8-sig", low_memory=False)
+    """Read an uploaded CSV into a DataFrame.
+
+    Parsed uploads are kept as Parquet files in the app's private directory,
+    keyed by a hash of the file contents, so uploading the same file again
+    (in another tab or session) skips CSV parsing entirely.
+    """
+    from strada.io.readers import load_csv, load_parquet
+
+    digest = _upload_digest(uploaded_file)
+    pq_path = _private_dir() / f"{digest}.parquet"
+    if pq_path.exists():
+        return load_parquet(pq_path)
+
+    df = load_csv(uploaded_file)
+
+    # Write-then-rename so concurrent sessions never see a partial file
+    tmp_path = pq_path.with_name(f"{pq_path.stem}-{uuid.uuid4().hex}.tmp")
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, pq_path)
+    except (OSError, ValueError, TypeError):
+        # The cache is best-effort; the parsed frame is still returned
+        tmp_path.unlink(missing_ok=True)
+
+    return df
+
+
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: _upload_digest})
+def _load_workbook(
+    uploaded_file,
+    olyckor_sheet: str,
+    personer_sheet: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Read the Olyckor and Personer sheets of an uploaded workbook in memory."""
+    from strada.io.readers import load_excel_sheets
+
+    sheets = load_excel_sheets(
+        io.BytesIO(uploaded_file.getbuffer()), [olyckor_sheet, personer_sheet]
+    )
+    return sheets[olyckor_sheet], sheets[personer_sheet]
+
+
+def _hash_frame(df: pd.DataFrame) -> bytes:
+    """Content hash of a DataFrame, used as the cache key for cached helpers."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.digest()
+
+
+@st.cache_data(show_spinner="Classifying…", hash_funcs={pd.DataFrame: _hash_frame})
+def _classify(df: pd.DataFrame):
+    """Run the classification pipeline, cached on the contents of *df*."""
+    from strada.core.classify import run_classification_pipeline
+
+    return run_classification_pipeline(df)
+
+
+@st.cache_data(show_spinner=False)
+def _run_check(
+    check_id: str,
+    olyckor_key: str,
+    personer_key: str,
+    _df_olyckor: pd.DataFrame,
+    _df_personer: pd.DataFrame,
+):
+    """Run one verification check, cached on the uploads' content hashes.
+
+    The DataFrames are excluded from the cache key (leading underscore);
+    *olyckor_key* / *personer_key* identify their contents instead.
+    """
+    from strada.core.verify import CHECK_REGISTRY
+
+    result = CHECK_REGISTRY[check_id](_df_olyckor, _df_personer)
+    # Convert details for display once, so the Arrow tables are cached too
+    for r in result.flat:
+        _ = r.details_table
+    return result
+
+
+@st.fragment
+def _details_expander(result) -> None:
+    """Collapsed expander whose table is only sent once it is opened.
+
+    Opening the expander reruns just this fragment, so the (possibly large)
+    details table is serialised on demand rather than on every render.
+    """
+    expander = st.expander(
+        f"{result.check_id}: {result.check_name} — {len(result.details):,} issues",
+        key=f"exp_{result.check_id}",
+        on_change="rerun",
+    )
+    with expander:
+        if expander.open:
+            st.dataframe(result.details_table, width='stretch', hide_index=True)
+
+
+def _table_to_csv_bytes(table) -> bytes:
+    """Encode an Arrow table as UTF-8 CSV with a BOM, in memory."""
+    import pyarrow as pa
+    from strada.io.readers import write_table_csv
+
+    sink = pa.BufferOutputStream()
+    write_table_csv(table, sink)
+    return sink.getvalue().to_pybytes()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -122,87 +260,72 @@ with tab_verify:
         include_cycling = any(c.startswith("C") for c in selected)
 
         if st.button("▶ Run selected checks", type="primary", key="btn_verify"):
-            from strada.core.verify import run_checks
-            from strada.io.reporters import write_text_report, write_csv_report
-
+            import pyarrow as pa
+            from strada.core.verify import select_checks
+            from strada.io.reporters import STATUS_ICONS, write_text_report, write_csv_report
+
+            # Each check is cached on the uploads' contents, so toggling a
+            # checkbox only runs the checks that have not been run yet
+            olyckor_key = _upload_digest(olyckor_file)
+            personer_key = _upload_digest(personer_file)
             with st.spinner("Running verification checks…"):
-                results = run_checks(
-                    df_olyckor,
-                    df_personer,
-                    include_cycling=include_cycling,
-                    checks=selected if selected else None,
-                )
+                results = [
+                    _run_check(check_id, olyckor_key, personer_key, df_olyckor, df_personer)
+                    for check_id in select_checks(
+                        include_cycling=include_cycling,
+                        checks=selected if selected else None,
+                    )
+                ]
 
             # ── Summary table ─────────────────────────────────────────────
             st.subheader("Results")
 
-            summary_rows = []
-            for r in results:
-                icon = {"pass": "✓", "warning": "⚠", "fail": "✗"}.get(r.status, "?")
-                summary_rows.append({
-                    "Check": r.check_id,
-                    "Status": f"{icon} {r.status}",
-                    "Issues": r.issue_count,
-                    "Description": r.check_name,
-                })
-                for sub in r.sub_results:
-                    sub_icon = {"pass": "✓", "warning": "⚠", "fail": "✗"}.get(sub.status, "?")
-                    summary_rows.append({
-                        "Check": f"  {sub.check_id}",
-                        "Status": f"{sub_icon} {sub.status}",
-                        "Issues": sub.issue_count,
-                        "Description": sub.check_name,
-                    })
-
-            st.dataframe(
-                pd.DataFrame(summary_rows),
-                width='stretch',
-                hide_index=True,
-            )
+            # Parent checks followed by their sub-checks, in report order
+            rows = [(x, x is not r) for r in results for x in r.flat]
+            all_res = [x for x, _ in rows]
 
-            # ── Expandable details ────────────────────────────────────────
-            all_res = []
-            for r in results:
-                all_res.append(r)
-                all_res.extend(r.sub_results)
+            summary = pa.table({
+                "Check": [f"  {x.check_id}" if is_sub else x.check_id for x, is_sub in rows],
+                "Status": [f"{STATUS_ICONS.get(x.status, '?')} {x.status}" for x, _ in rows],
+                "Issues": pa.array([x.issue_count for x, _ in rows], type=pa.int64()),
+                "Description": [x.check_name for x, _ in rows],
+            })
+
+            st.dataframe(summary, width='stretch', hide_index=True)
 
+            # ── Expandable details ────────────────────────────────────────
             for r in all_res:
-                if r.details is not None and len(r.details) > 0:
-                    with st.expander(
-                        f"{r.check_id}: {r.check_name} — {len(r.details):,} issues"
-                    ):
-                        st.dataframe(r.details, width='stretch', hide_index=True)
+                if r.has_details:
+                    _details_expander(r)
 
             # ── Download buttons ──────────────────────────────────────────
             st.subheader("Download reports")
             dl1, dl2 = st.columns(2)
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                txt_path = write_text_report(
-                    results,
-                    Path(tmpdir) / "report.txt",
-                    olyckor_count=len(df_olyckor),
-                    personer_count=len(df_personer),
+            txt_buf = io.StringIO()
+            write_text_report(
+                results,
+                txt_buf,
+                olyckor_count=len(df_olyckor),
+                personer_count=len(df_personer),
+            )
+            csv_buf = io.BytesIO()
+            write_csv_report(results, csv_buf)
+
+            with dl1:
+                st.download_button(
+                    "📄 Download text report",
+                    data=txt_buf.getvalue(),
+                    file_name="strada_quality_report.txt",
+                    mime="text/plain",
                 )
-                csv_path = write_csv_report(
-                    results,
-                    Path(tmpdir) / "report.csv",
+            with dl2:
+                st.download_button(
+                    "📊 Download CSV report",
+                    data=csv_buf.getvalue(),
+                    file_name="strada_quality_report.csv",
+                    mime="text/csv",
                 )
-
-                with dl1:
-                    st.download_button(
-                        "📄 Download text report",
-                        data=txt_path.read_text(encoding="utf-8"),
-                        file_name="strada_quality_report.txt",
-                        mime="text/plain",
-                    )
-                with dl2:
-                    st.download_button(
-                        "📊 Download CSV report",
-                        data=csv_path.read_bytes(),
-                        file_name="strada_quality_report.csv",
-                        mime="text/csv",
-                    )
     else:
         st.info("👆 Upload both CSV files to get started.")
 
@@ -227,16 +350,14 @@ with tab_classify:
         st.success(f"Loaded **{len(df_cls):,}** person records.")
 
         if st.button("▶ Run classification", type="primary", key="btn_classify"):
-            from strada.core.classify import run_classification_pipeline
-
-            with st.spinner("Classifying…"):
-                df_out, verif_results, multi_matches, stats = run_classification_pipeline(df_cls)
+            df_out, verif_results, multi_matches, stats = _classify(df_cls)
 
             # Summary
-            cykel = df_out[df_out["Micromobility_type"] != "N/A"]
-            if len(cykel) > 0:
+            type_counts = df_out["Micromobility_type"].value_counts()
+            type_counts = type_counts[(type_counts.index != "N/A") & (type_counts > 0)]
+            if len(type_counts) > 0:
                 st.subheader("Classification Summary")
-                counts = cykel["Micromobility_type"].value_counts().reset_index()
+                counts = type_counts.reset_index()
                 counts.columns = ["Type", "Count"]
                 counts["Percentage"] = (counts["Count"] / counts["Count"].sum() * 100).round(1)
                 st.dataframe(counts, width='stretch', hide_index=True)
@@ -255,15 +376,35 @@ with tab_classify:
                         with st.expander(f"Details for {v.check_id}"):
                             st.dataframe(v.details, width='stretch', hide_index=True)
 
-            # Download
-            csv_buf = io.BytesIO()
-            df_out.to_csv(csv_buf, index=False, encoding="utf-8-sig")
-            st.download_button(
-                "📥 Download classified dataset",
-                data=csv_buf.getvalue(),
-                file_name="Personer-analysis-ready.csv",
-                mime="text/csv",
-            )
+            # Download — the CSV is written once per upload to a file in the
+            # private directory (removed with it when the server stops) and
+            # streamed from disk instead of held as a second in-memory copy
+            cached = st.session_state.get("classified_csv")
+            if cached is None or cached[0] != personer_cls.file_id or not cached[1].exists():
+                import pyarrow as pa
+                from strada.io.readers import write_table_csv
+
+                if cached is not None:
+                    cached[1].unlink(missing_ok=True)
+
+                tbl_out = pa.Table.from_pandas(
+                    df_out, preserve_index=False, nthreads=os.cpu_count()
+                )
+                with tempfile.NamedTemporaryFile(
+                    dir=_private_dir(), delete=False,
+                    prefix="classified-", suffix=".csv",
+                ) as tmp:
+                    write_table_csv(tbl_out, tmp)
+                cached = (personer_cls.file_id, Path(tmp.name))
+                st.session_state["classified_csv"] = cached
+
+            with open(cached[1], "rb") as csv_file:
+                st.download_button(
+                    "📥 Download classified dataset",
+                    data=csv_file,
+                    file_name="Personer-analysis-ready.csv",
+                    mime="text/csv",
+                )
     else:
         st.info("👆 Upload a Personer CSV file to classify micromobility types.")
 
@@ -302,55 +443,60 @@ with tab_preprocess:
 
     if excel_file:
         if st.button("▶ Convert", type="primary", key="btn_preprocess"):
-            from strada.io.readers import load_excel_sheet, save_csv
-            from strada.core.preprocess import filter_by_year
+            import pyarrow as pa
+            from strada.core.preprocess import filter_table_by_year
 
             with st.spinner("Reading Excel file…"):
-                # Save uploaded file to temp location
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
-                    tmp.write(excel_file.read())
-                    tmp_path = Path(tmp.name)
-
-                df_o = load_excel_sheet(tmp_path, olyckor_sheet)
-                df_p = load_excel_sheet(tmp_path, personer_sheet)
+                df_o, df_p = _load_workbook(excel_file, olyckor_sheet, personer_sheet)
 
             st.success(
                 f"Read **{len(df_o):,}** crashes and **{len(df_p):,}** persons."
             )
 
-            downloads = {}
+            # Convert once to Arrow; filtering and CSV encoding stay in Arrow
+            tbl_o = pa.Table.from_pandas(df_o, preserve_index=False, nthreads=os.cpu_count())
+            tbl_p = pa.Table.from_pandas(df_p, preserve_index=False, nthreads=os.cpu_count())
+            del df_o, df_p
 
-            # Full dataset
-            buf_o = io.BytesIO()
-            df_o.to_csv(buf_o, index=False, encoding="utf-8-sig")
-            downloads["Olyckor.csv"] = buf_o.getvalue()
+            # Encode in background threads (Arrow releases the GIL) while
+            # the year filter runs on the main thread
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {}
 
-            buf_p = io.BytesIO()
-            df_p.to_csv(buf_p, index=False, encoding="utf-8-sig")
-            downloads["Personer.csv"] = buf_p.getvalue()
+                # Full dataset
+                futures["Olyckor.csv"] = pool.submit(_table_to_csv_bytes, tbl_o)
+                futures["Personer.csv"] = pool.submit(_table_to_csv_bytes, tbl_p)
 
-            if filter_years and start_year and end_year:
-                df_o_f = filter_by_year(df_o, start_year, end_year)
-                df_p_f = filter_by_year(df_p, start_year, end_year)
+                if filter_years and start_year and end_year:
+                    tbl_o_f = filter_table_by_year(tbl_o, start_year, end_year)
+                    tbl_p_f = filter_table_by_year(tbl_p, start_year, end_year)
 
-                st.info(
-                    f"Filtered: **{len(df_o_f):,}** crashes, **{len(df_p_f):,}** persons "
-                    f"({start_year}–{end_year})"
-                )
+                    st.info(
+                        f"Filtered: **{tbl_o_f.num_rows:,}** crashes, **{tbl_p_f.num_rows:,}** persons "
+                        f"({start_year}–{end_year})"
+                    )
 
-                buf_of = io.BytesIO()
-                df_o_f.to_csv(buf_of, index=False, encoding="utf-8-sig")
-                downloads[f"Olyckor-{start_year}-{end_year}.csv"] = buf_of.getvalue()
+                    futures[f"Olyckor-{start_year}-{end_year}.csv"] = pool.submit(
+                        _table_to_csv_bytes, tbl_o_f
+                    )
+                    futures[f"Personer-{start_year}-{end_year}.csv"] = pool.submit(
+                        _table_to_csv_bytes, tbl_p_f
+                    )
 
-                buf_pf = io.BytesIO()
-                df_p_f.to_csv(buf_pf, index=False, encoding="utf-8-sig")
-                downloads[f"Personer-{start_year}-{end_year}.csv"] = buf_pf.getvalue()
+                # Add each CSV to one archive as soon as it is encoded, so
+                # only the ZIP is kept for the download
+                zip_buf = io.BytesIO()
+                with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+                    for name in list(futures):
+                        zf.writestr(name, futures.pop(name).result())
 
             st.subheader("Download converted files")
-            cols = st.columns(len(downloads))
-            for i, (name, data) in enumerate(downloads.items()):
-                with cols[i]:
-                    st.download_button(f"📥 {name}", data=data, file_name=name, mime="text/csv")
+            st.download_button(
+                "📦 Download all (zip)",
+                data=zip_buf.getvalue(),
+                file_name="strada-preprocess.zip",
+                mime="application/zip",
+            )
     else:
         st.info("👆 Upload a STRADA Excel workbook to get started.")
 
@@ -24,12 +24,14 @@ Usage examples::
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="strada",
@@ -37,7 +39,14 @@ app = typer.Typer(
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
+
+
+@lru_cache(maxsize=None)
+def _console() -> Console:
+    """Shared rich console, created on first use so ``--help`` stays fast."""
+    from rich.console import Console
+
+    return Console()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -66,10 +75,22 @@ def preprocess(
     ),
     olyckor_sheet: str = typer.Option("Olyckor", "--olyckor-sheet"),
     personer_sheet: str = typer.Option("Personer", "--personer-sheet"),
+    output_format: str = typer.Option(
+        "csv", "--format",
+        help="Output file format: csv or parquet.",
+    ),
 ):
     """Convert a STRADA Excel workbook to CSV and optionally filter by year."""
+    from rich.table import Table
     from strada.core.preprocess import preprocess_pipeline
 
+    output_format = output_format.lower()
+    if output_format not in ("csv", "parquet"):
+        raise typer.BadParameter(
+            "must be 'csv' or 'parquet'", param_hint="--format"
+        )
+
+    console = _console()
     console.print(f"\n[bold]Reading:[/bold] {excel_file}")
     result = preprocess_pipeline(
         excel_file,
@@ -78,6 +99,7 @@ def preprocess(
         end_year=end_year,
         olyckor_sheet=olyckor_sheet,
         personer_sheet=personer_sheet,
+        fmt=output_format,
     )
 
     table = Table(title="Preprocessing Results")
@@ -135,24 +157,76 @@ def verify(
         "both", "--format",
         help="Report format: 'txt', 'csv', or 'both'.",
     ),
+    chunk_size: Optional[int] = typer.Option(
+        None, "--chunk-size",
+        help=(
+            "Stream the Personer CSV in chunks of about this many MB. "
+            "G1, G3 and G6 then run without loading the whole file; "
+            "other selected checks still load it."
+        ),
+        min=1,
+    ),
+    parallel: bool = typer.Option(
+        False, "--parallel",
+        help="Run the checks in parallel worker processes (multi-core machines).",
+    ),
 ):
     """Run data-quality verification checks on STRADA CSV files."""
-    from strada.io.readers import load_csv
-    from strada.core.verify import run_checks
+    from rich.table import Table
+    from strada.io.readers import iter_csv, load_csv
+    from strada.core.verify import (
+        OLYCKOR_COLUMNS,
+        PERSONER_COLUMNS,
+        run_checks,
+        run_checks_chunked,
+    )
     from strada.io.reporters import write_text_report, write_csv_report
 
+    console = _console()
     console.print(f"\n[bold]Loading data…[/bold]")
-    df_olyckor = load_csv(olyckor)
-    df_personer = load_csv(personer)
-    console.print(f"  Crashes: {len(df_olyckor):,}   Persons: {len(df_personer):,}")
-
-    console.print(f"\n[bold]Running checks…[/bold]")
-    results = run_checks(
-        df_olyckor,
-        df_personer,
-        include_cycling=cycling,
-        checks=checks,
-    )
+    df_olyckor = load_csv(olyckor, columns=OLYCKOR_COLUMNS)
+
+    if chunk_size is None:
+        df_personer = load_csv(personer, columns=PERSONER_COLUMNS)
+        n_personer = len(df_personer)
+        console.print(f"  Crashes: {len(df_olyckor):,}   Persons: {n_personer:,}")
+
+        console.print(f"\n[bold]Running checks…[/bold]")
+        results = run_checks(
+            df_olyckor,
+            df_personer,
+            include_cycling=cycling,
+            checks=checks,
+            parallel=parallel,
+        )
+    else:
+        console.print(f"  Crashes: {len(df_olyckor):,}   Persons: streamed in ~{chunk_size} MB chunks")
+
+        n_personer = 0
+
+        def _counted_chunks():
+            nonlocal n_personer
+            n_personer = 0
+            for chunk in iter_csv(personer, chunk_size, columns=PERSONER_COLUMNS):
+                n_personer += len(chunk)
+                yield chunk
+
+        def _load_personer():
+            nonlocal n_personer
+            df = load_csv(personer, columns=PERSONER_COLUMNS)
+            n_personer = len(df)
+            return df
+
+        console.print(f"\n[bold]Running checks…[/bold]")
+        results = run_checks_chunked(
+            df_olyckor,
+            _counted_chunks(),
+            _load_personer,
+            include_cycling=cycling,
+            checks=checks,
+            parallel=parallel,
+        )
+        console.print(f"  Persons: {n_personer:,}")
 
     # ── Summary table ──────────────────────────────────────────────────────
     summary = Table(title="Verification Summary")
@@ -179,7 +253,7 @@ def verify(
             results,
             output_dir / "strada_quality_report.txt",
             olyckor_count=len(df_olyckor),
-            personer_count=len(df_personer),
+            personer_count=n_personer,
         )
         console.print(f"\n  Text report: [cyan]{txt_path}[/cyan]")
 
@@ -214,31 +288,74 @@ def classify(
         "Personer-analysis-ready.csv", "--output-name",
         help="File name for the output CSV.",
     ),
+    chunk_size: Optional[int] = typer.Option(
+        None, "--chunk-size",
+        help=(
+            "Stream the Personer CSV in chunks of about this many MB and "
+            "write the output as it goes (rows of a crash must be adjacent)."
+        ),
+        min=1,
+    ),
 ):
     """Classify micromobility types and add conflict-partner column (cycling analysis)."""
-    from strada.io.readers import load_csv
+    import pandas as pd
+    from strada.io.readers import iter_csv, load_csv
+    from rich.table import Table
     from strada.io.reporters import write_text_report
-    from strada.core.classify import run_classification_pipeline
+    from strada.core.classify import (
+        run_classification_pipeline,
+        run_classification_pipeline_chunked,
+    )
     from strada.io.readers import save_csv
+    from strada.config.constants import CSV_ENCODING
 
-    console.print(f"\n[bold]Loading data…[/bold]")
-    df = load_csv(personer)
-    console.print(f"  Persons: {len(df):,}")
+    console = _console()
+    output_dir = Path(output_dir)
 
-    console.print(f"\n[bold]Classifying micromobility types…[/bold]")
-    df, verif_results, multi_matches, stats = run_classification_pipeline(df)
+    if chunk_size is None:
+        console.print(f"\n[bold]Loading data…[/bold]")
+        df = load_csv(personer)
+        n_personer = len(df)
+        console.print(f"  Persons: {n_personer:,}")
+
+        console.print(f"\n[bold]Classifying micromobility types…[/bold]")
+        df, verif_results, multi_matches, stats = run_classification_pipeline(df)
+        counts = df["Micromobility_type"].value_counts()
+        out_path = save_csv(df, output_dir / output_name)
+    else:
+        console.print(f"\n[bold]Classifying micromobility types…[/bold]")
+        console.print(f"  Persons: streamed in ~{chunk_size} MB chunks")
+        out_path = output_dir / output_name
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        n_personer = 0
+        counts = pd.Series(dtype="int64")
+
+        with open(out_path, "w", encoding=CSV_ENCODING, newline="") as out:
+            def _write_chunk(chunk):
+                nonlocal n_personer, counts
+                chunk.to_csv(out, index=False, header=n_personer == 0)
+                n_personer += len(chunk)
+                counts = counts.add(
+                    chunk["Micromobility_type"].value_counts(), fill_value=0
+                )
+
+            verif_results, multi_matches, stats = run_classification_pipeline_chunked(
+                iter_csv(personer, chunk_size), _write_chunk
+            )
+        counts = counts.astype("int64").sort_values(ascending=False)
+        console.print(f"  Persons: {n_personer:,}")
 
     # Classification summary
-    cykel = df[df["Micromobility_type"] != "N/A"]
-    if len(cykel) > 0:
+    counts = counts[(counts.index != "N/A") & (counts > 0)]
+    n_cykel = counts.sum()
+    if n_cykel > 0:
         table = Table(title="Micromobility Classification")
         table.add_column("Type", style="cyan")
         table.add_column("Count", justify="right")
         table.add_column("%", justify="right")
 
-        counts = cykel["Micromobility_type"].value_counts()
         for cat, cnt in counts.items():
-            pct = cnt / len(cykel) * 100
+            pct = cnt / n_cykel * 100
             table.add_row(str(cat), f"{cnt:,}", f"{pct:.1f}%")
 
         console.print(table)
@@ -251,9 +368,6 @@ def classify(
         icon = {"pass": "[green]✓[/green]", "warning": "[yellow]⚠[/yellow]"}.get(v.status, "?")
         console.print(f"  {icon} {v.check_id}: {v.summary}")
 
-    # Save
-    output_dir = Path(output_dir)
-    out_path = save_csv(df, output_dir / output_name)
     console.print(f"\n  Saved: [cyan]{out_path}[/cyan]")
 
     # Also save the text report
@@ -261,7 +375,7 @@ def classify(
         verif_results,
         output_dir / "micromobility_classification_report.txt",
         title="Micromobility Classification Report",
-        personer_count=len(df),
+        personer_count=n_personer,
     )
     console.print(f"  Report: [cyan]{report_path}[/cyan]")
     console.print("\n[green]✓ Classification complete.[/green]\n")
@@ -276,14 +390,22 @@ def web(
     port: int = typer.Option(8501, "--port", "-p", help="Port for the Streamlit server."),
 ):
     """Launch the STRADA Toolbox web dashboard."""
+    import os
     import subprocess
     import sys
 
     app_path = Path(__file__).parent / "app.py"
-    console.print(f"\n[bold]Launching web dashboard on port {port}…[/bold]\n")
-    subprocess.run(
-        [sys.executable, "-m", "streamlit", "run", str(app_path), "--server.port", str(port)],
-    )
+    _console().print(f"\n[bold]Launching web dashboard on port {port}…[/bold]\n")
+    cmd = [sys.executable, "-m", "streamlit", "run", str(app_path), "--server.port", str(port)]
+
+    if os.name == "nt":
+        # exec* on Windows spawns a new process and exits, detaching the console
+        subprocess.run(cmd, shell=False)
+    else:
+        # Replace this process with Streamlit instead of waiting on it
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, cmd)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -86,6 +86,23 @@ DUPLICATE_DETECTION_COLS = [
     COL_CATEGORY_MAIN,
 ]
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Low-cardinality text columns (candidates for ``category`` dtype)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CATEGORICAL_COLS = [
+    COL_CRASH_TYPE,
+    COL_CATEGORY_MAIN,
+    COL_CATEGORY_SUB,
+    COL_CATEGORY_P,
+    COL_CATEGORY_S,
+    COL_GENDER,
+    COL_COUNTY,
+    COL_MUNICIPALITY,
+    COL_ROLE_P,
+    COL_ROLE_S,
+]
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Micromobility classification keywords  (cycling-specific)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -135,9 +152,10 @@ MICROMOBILITY_KEYWORDS: dict[str, list[str]] = {
     ],
 }
 
-WHOLE_WORD_KEYWORDS: set[str] = {
+# Keywords that only count as whole words (too short / too common otherwise)
+WHOLE_WORD_KEYWORDS: frozenset[str] = frozenset({
     "voi", "voien", "voj", "lime", "bird", "tier", "ryde", "spark",
-}
+})
 
 MICROMOBILITY_PRIORITY: list[str] = [
     "E-scooter",
@@ -147,12 +165,15 @@ MICROMOBILITY_PRIORITY: list[str] = [
     "Conventional bicycle",
 ]
 
-ELECTRIC_UNDERGRUPP: set[str] = {
+# All Micromobility_type labels (categories of the categorical column)
+MICROMOBILITY_TYPES: list[str] = [*MICROMOBILITY_PRIORITY, "N/A"]
+
+ELECTRIC_UNDERGRUPP: frozenset[str] = frozenset({
     "Elcykel",
     "Eldrivet enpersonsfordon",
     "Sparkcykel",
     "Eldriven rullstol",
-}
+})
 
 # Undergrupp → Micromobility_type mapping (used in Step 3 fallback)
 UNDERGRUPP_MAP: dict[str, str] = {
@@ -169,18 +190,18 @@ UNDERGRUPP_MAP: dict[str, str] = {
 
 # "I Konflikt med - Undergrupp" values indicating the CONFLICT PARTNER is
 # a specific micromobility type (used in Step 2 Guard B, hospital-only)
-CONFLICT_PARTNER_EXCLUSIONS: dict[str, set[str]] = {
-    "E-scooter": {"Eldrivet enpersonsfordon", "Sparkcykelåkare"},
-    "E-bike": {"Elcykel"},
-    "rullstol/permobil": {"Eldriven rullstol", "Rullstolsburen"},
+CONFLICT_PARTNER_EXCLUSIONS: dict[str, frozenset[str]] = {
+    "E-scooter": frozenset({"Eldrivet enpersonsfordon", "Sparkcykelåkare"}),
+    "E-bike": frozenset({"Elcykel"}),
+    "rullstol/permobil": frozenset({"Eldriven rullstol", "Rullstolsburen"}),
 }
 
 # Undergrupp (P) values that indicate a specific electric type (Step 1 Guard C)
-SPECIFIC_UNDERGRUPP_P: set[str] = {
+SPECIFIC_UNDERGRUPP_P: frozenset[str] = frozenset({
     "Eldrivet enpersonsfordon",
     "Elcykel",
     "Eldriven rullstol",
-}
+})
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Default encoding used for STRADA CSV exports
@@ -25,9 +25,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from strada.config.constants import (
     COL_CRASH_ID,
@@ -42,6 +46,7 @@ from strada.config.constants import (
     MICROMOBILITY_KEYWORDS,
     WHOLE_WORD_KEYWORDS,
     MICROMOBILITY_PRIORITY,
+    MICROMOBILITY_TYPES,
     ELECTRIC_UNDERGRUPP,
     UNDERGRUPP_MAP,
     CONFLICT_PARTNER_EXCLUSIONS,
@@ -72,14 +77,139 @@ class ClassificationStats:
         "Step2_GuardA": 0, "Step2_GuardB": 0, "Step2_GuardC": 0,
     })
 
+    def merge(self, other: ClassificationStats) -> None:
+        """Add the counts of *other* (e.g. from another chunk) to these."""
+        self.total_cykel += other.total_cykel
+        self.solo_cykel_crashes += other.solo_cykel_crashes
+        self.multi_cykel_crashes += other.multi_cykel_crashes
+        self.multi_cykel_persons += other.multi_cykel_persons
+        for key, count in other.step_counts.items():
+            self.step_counts[key] = self.step_counts.get(key, 0) + count
+        for key, count in other.guard_counts.items():
+            self.guard_counts[key] = self.guard_counts.get(key, 0) + count
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Keyword matching
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _trie_pattern(words: list[str]) -> str:
+    """Return a regex matching any of *words*, factored as a prefix trie.
+
+    ``["elspark", "elscooter"]`` becomes ``el(?:s(?:park|cooter))``-style
+    nesting, so the regex engine tries a handful of next characters at each
+    text position instead of every keyword in turn.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def _emit(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + _emit(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _emit(trie)
+
+
+# Compared against lower-cased keywords, so normalise the case once here
+_WHOLE_WORD: frozenset[str] = frozenset(kw.lower() for kw in WHOLE_WORD_KEYWORDS)
+
+
+def _category_pattern(keywords: list[str]) -> re.Pattern[str]:
+    """Compile one trie-shaped regex matching any keyword of a category.
+
+    Keywords in ``WHOLE_WORD_KEYWORDS`` only match as whole words; they share
+    a single ``\\b(?:…)\\b`` group so the word-boundary assertions run once
+    per position rather than once per keyword.  All other keywords match as
+    plain substrings.
+
+    Duplicates are dropped, as is any keyword containing a shorter substring
+    keyword of the same category (``"elsparkcykel"`` can only match where
+    ``"elspark"`` already does), which keeps the pattern small.
+    """
+    lowered = list(dict.fromkeys(kw.lower() for kw in keywords))
+    substrings = [kw for kw in lowered if kw not in _WHOLE_WORD]
+
+    whole: list[str] = []
+    parts: list[str] = []
+    for kw in lowered:
+        if any(sub != kw and sub in kw for sub in substrings):
+            continue
+        target = whole if kw in _WHOLE_WORD else parts
+        target.append(kw)
+
+    pattern = _trie_pattern(parts)
+    if whole:
+        whole_pattern = r"\b(?:" + _trie_pattern(whole) + r")\b"
+        pattern = f"{pattern}|{whole_pattern}" if pattern else whole_pattern
+    return re.compile(pattern)
+
+
+def _compile_category_patterns(
+    keywords_dict: dict[str, list[str]],
+) -> dict[str, re.Pattern[str]]:
+    """Compile ``{category: [keyword, …]}`` into ``{category: regex}``."""
+    return {
+        category: _category_pattern(keywords)
+        for category, keywords in keywords_dict.items()
+    }
+
+
+# Built once at import: every narrative is scanned with one compiled regex
+# per category instead of one substring test per keyword.
+_CATEGORY_PATTERNS = _compile_category_patterns(MICROMOBILITY_KEYWORDS)
+
+# One bit per keyword category (in MICROMOBILITY_KEYWORDS order), so the set
+# of categories a narrative matched packs into a single uint8
+_CATEGORY_BITS: dict[str, int] = {
+    category: 1 << bit for bit, category in enumerate(_CATEGORY_PATTERNS)
+}
+_MASK_CATEGORIES: list[tuple[str, ...]] = [
+    tuple(cat for cat, bit in _CATEGORY_BITS.items() if mask & bit)
+    for mask in range(1 << len(_CATEGORY_BITS))
+]
+
+
+def _patterns_for(
+    keywords_dict: dict[str, list[str]] | None,
+) -> dict[str, re.Pattern[str]]:
+    """Return the compiled patterns for *keywords_dict* (default: prebuilt).
+
+    Custom keyword sets are compiled once and cached by content, so the
+    per-row helpers do not rebuild their patterns on every call.
+    """
+    if keywords_dict is None or keywords_dict is MICROMOBILITY_KEYWORDS:
+        return _CATEGORY_PATTERNS
+    return _cached_category_patterns(
+        tuple((category, tuple(kws)) for category, kws in keywords_dict.items())
+    )
+
+
+@lru_cache(maxsize=16)
+def _cached_category_patterns(
+    keyword_items: tuple[tuple[str, tuple[str, ...]], ...],
+) -> dict[str, re.Pattern[str]]:
+    """Memoised :func:`_compile_category_patterns` over a hashable keyword set."""
+    return _compile_category_patterns(
+        {category: list(kws) for category, kws in keyword_items}
+    )
+
+
 def _find_keyword_matches(
     text: str,
     keywords_dict: dict[str, list[str]] | None = None,
+    *,
+    lowered: bool = False,
 ) -> list[str]:
     """Return a list of category names that have at least one keyword match.
 
@@ -90,48 +220,201 @@ def _find_keyword_matches(
     keywords_dict : dict, optional
         ``{category_name: [keyword, …]}``.  Defaults to
         ``MICROMOBILITY_KEYWORDS``.
+    lowered : bool
+        ``True`` if *text* is already lower-cased, skipping ``str.lower``.
 
     Returns
     -------
     list[str] — matched category names (may be empty).
     """
-    if keywords_dict is None:
-        keywords_dict = MICROMOBILITY_KEYWORDS
-
-    text_lower = text.lower()
-    matches: list[str] = []
-
-    for category, keywords in keywords_dict.items():
-        for kw in keywords:
-            kw_lower = kw.lower()
-            if kw_lower in WHOLE_WORD_KEYWORDS:
-                if re.search(r"\b" + re.escape(kw_lower) + r"\b", text_lower):
-                    matches.append(category)
-                    break
-            else:
-                if kw_lower in text_lower:
-                    matches.append(category)
-                    break
+    patterns = _patterns_for(keywords_dict)
+    text_lower = text if lowered else text.lower()
+    return [
+        category
+        for category, pattern in patterns.items()
+        if pattern.search(text_lower)
+    ]
 
-    return matches
+
+def _first_priority_match(
+    text_lower: str,
+    keywords_dict: dict[str, list[str]] | None = None,
+) -> str | None:
+    """Return the highest-priority category matching *text_lower*.
+
+    Same result as ``_resolve_priority(_find_keyword_matches(...))`` but the
+    categories are tried in ``MICROMOBILITY_PRIORITY`` order and the scan
+    stops at the first hit, so lower-priority patterns are usually skipped.
+    """
+    patterns = _patterns_for(keywords_dict)
+    for category in MICROMOBILITY_PRIORITY:
+        pattern = patterns.get(category)
+        if pattern is not None and pattern.search(text_lower):
+            return category
+    return None
+
+
+def _lowered_narratives(texts: pd.Series) -> pd.Series:
+    """Lower-case a narrative column once, dropping missing and blank rows.
+
+    The result feeds both the column-wise keyword scan and the per-row
+    guards, so no narrative is case-folded more than once.
+    """
+    if isinstance(texts.dtype, pd.StringDtype):
+        # Already string-typed (the default for text under pandas 3, where
+        # it is Arrow-backed): hand the buffers to Arrow as they are
+        arr = pa.array(texts.array)
+    else:
+        texts = texts[texts.notna()].astype(str)
+        arr = pa.array(texts, type=pa.large_string(), from_pandas=True)
+
+    # Blank test and case folding run in Arrow's UTF-8 kernels; the result
+    # stays Arrow-backed so factorizing it later is a dictionary encode.
+    # Missing values compare as null, which the fill drops with the blanks.
+    keep = pc.fill_null(pc.not_equal(pc.utf8_trim_whitespace(arr), ""), False)
+    lowered = pc.utf8_lower(pc.filter(arr, keep))
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(lowered),
+        index=texts.index[keep.to_numpy(zero_copy_only=False)],
+    )
+
+
+def _stripped(values: pd.Series) -> np.ndarray:
+    """Whitespace-stripped text of *values* as an object array.
+
+    Missing entries become ``None``, so the per-row guards can test and
+    compare the structured Undergrupp columns without re-stripping them.
+    """
+    present = values.notna().to_numpy(dtype=bool)
+    out = np.full(len(values), None, dtype=object)
+    out[present] = values[present].astype(str).str.strip().to_numpy(dtype=object)
+    return out
+
+
+def _match_keyword_column(lowered: pd.Series) -> pd.Series:
+    """Vectorised ``_find_keyword_matches`` over a column of narratives.
+
+    Each category's regex is run through ``Series.str.contains`` over the
+    distinct narratives, so the keyword scan happens per column rather than
+    per row.
+
+    Parameters
+    ----------
+    lowered : pd.Series
+        Lower-cased, non-blank narratives from ``_lowered_narratives``.
+
+    Returns
+    -------
+    pd.Series
+        uint8 mask per entry (same index as *lowered*), ORing together the
+        ``_CATEGORY_BITS`` of each matched category.
+    """
+    # Police narratives are shared across a crash, so many rows carry the
+    # same text: scan each distinct narrative once and gather back
+    codes, uniques = lowered.factorize()
+    # Regexes run on Python strings: Arrow's RE2 engine only knows ASCII
+    # word boundaries, which would misplace \b next to å/ä/ö
+    uniques = pd.Series(uniques.to_numpy(), dtype=object)
+
+    unique_masks = np.zeros(len(uniques), dtype=np.uint8)
+    for category, pattern in _CATEGORY_PATTERNS.items():
+        hit = uniques.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        unique_masks[hit] |= _CATEGORY_BITS[category]
+    return pd.Series(unique_masks[codes], index=lowered.index)
+
+
+def _positional_masks(masks: pd.Series, index: pd.Index) -> np.ndarray:
+    """Spread ``_match_keyword_column`` output over the positions of *index*.
+
+    Rows without a narrative (absent from *masks*) get mask 0, exactly like
+    rows whose narrative matched no keyword.
+    """
+    out = np.zeros(len(index), dtype=np.uint8)
+    out[index.get_indexer(masks.index)] = masks.to_numpy()
+    return out
+
+
+# Micromobility_type label → categorical code
+_TYPE_CODES: dict[str, int] = {
+    label: code for code, label in enumerate(MICROMOBILITY_TYPES)
+}
+
+# Categories of Classification_confidence / Classification_step; "" marks
+# the non-Cykel rows the classifier does not touch
+_CONFIDENCE_LEVELS: list[str] = ["high", "medium", "low", "default", ""]
+_STEP_LABELS: list[str] = [
+    "Step 1 (P, solo)",
+    "Step 1 (P, Guard B: TE Nr)",
+    "Step 1 (P, Guard C: UG cross-ref)",
+    "Step 2 (S, solo)",
+    "Step 2 (S, Guard B: I Konflikt med)",
+    "Step 2 (S, Guard C: per-person assumption)",
+    "Step 3 (Undergrupp fallback)",
+    "Step 4 (default)",
+    "",
+]
+_CONFIDENCE_CODES: dict[str, int] = {
+    label: code for code, label in enumerate(_CONFIDENCE_LEVELS)
+}
+_STEP_CODES: dict[str, int] = {
+    label: code for code, label in enumerate(_STEP_LABELS)
+}
+
+_PRIORITY_RANK: dict[str, int] = {
+    cat: rank for rank, cat in enumerate(MICROMOBILITY_PRIORITY)
+}
 
 
 def _resolve_priority(matches: list[str]) -> str | None:
     """Given a list of matched categories, return the highest-priority one."""
-    for cat in MICROMOBILITY_PRIORITY:
-        if cat in matches:
-            return cat
-    return None
+    ranked = [cat for cat in matches if cat in _PRIORITY_RANK]
+    return min(ranked, key=_PRIORITY_RANK.__getitem__, default=None)
+
+
+# Category mask → type code of its highest-priority category (N/A for 0)
+_MASK_TYPE_CODES = np.array(
+    [
+        _TYPE_CODES[_resolve_priority(list(cats)) or "N/A"]
+        for cats in _MASK_CATEGORIES
+    ],
+    dtype=np.int8,
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Step 1 Guard B: Trafikelement Nr disambiguation
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Numbered references such as "cyklist 1 (elsparkcykel)": anchor word and
+# number are found in one pass per narrative, for every TE Nr at once
+_REF_ANCHOR = re.compile(r"(?:cyklist|förare|trafikant|fordon|part)\s*(\d+)")
+# The description following a referenced number
+_REF_CONTEXT = re.compile(r"\s*\(?\s*(.{1,80})")
+
+
+@lru_cache(maxsize=None)
+def _ref_pattern(te_nr: str) -> re.Pattern[str]:
+    """Reference pattern for a non-numeric Trafikelement Nr (rare)."""
+    return re.compile(
+        r"(?:cyklist|förare|trafikant|fordon|part)\s*"
+        + re.escape(te_nr)
+        + r"\s*\(?\s*(.{1,80})"
+    )
+
+
+def _reference_anchors(text_lower: str) -> list[tuple[str, int]]:
+    """``(number, offset)`` of every numbered reference in *text_lower*."""
+    return [
+        (match.group(1), match.start(1))
+        for match in _REF_ANCHOR.finditer(text_lower)
+    ]
+
+
 def _try_trafikelement_disambiguation(
     text_p: str,
     person_te_nr: Any,
     keywords_dict: dict[str, list[str]],
+    anchors: list[tuple[str, int]] | None = None,
 ) -> str | None:
     """Try to associate keyword mentions in a shared (P) narrative with a
     specific ``Trafikelement Nr``.
@@ -139,122 +422,70 @@ def _try_trafikelement_disambiguation(
     Police narratives often use numbered references like
     ``'cyklist 1 (elsparkcykel)'`` or ``'fordon 2 (elcykel)'``.
 
+    *text_p* is expected to be lower-cased already.  *anchors* may pass in
+    ``_reference_anchors(text_p)`` when several persons share the text.
+
     Returns the category for *this* person's TE nr, or ``None`` if
     disambiguation is not possible.
     """
     if pd.isna(text_p) or text_p == "" or pd.isna(person_te_nr):
         return None
 
-    text_lower = str(text_p).lower()
+    text_lower = str(text_p)
     te_nr = str(person_te_nr).replace(".0", "")  # "1.0" → "1"
 
-    ref_patterns = [
-        r"(?:cyklist|förare|trafikant|fordon|part)\s*"
-        + re.escape(te_nr)
-        + r"\s*\(?\s*(.{1,80})",
-    ]
-
-    for pattern in ref_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            context_after = match.group(1)
-            found = _find_keyword_matches(context_after, keywords_dict)
-            if found:
-                return _resolve_priority(found)
+    if te_nr.isdigit():
+        # First reference whose number starts with this TE Nr, as a
+        # left-to-right search for "<anchor> <te_nr> <context>" would find
+        if anchors is None:
+            anchors = _reference_anchors(text_lower)
+        match = None
+        for number, offset in anchors:
+            if number.startswith(te_nr):
+                match = _REF_CONTEXT.match(text_lower, offset + len(te_nr))
+                if match:
+                    break
+    else:
+        match = _ref_pattern(te_nr).search(text_lower)
 
-    return None
+    if match is None:
+        return None
+    # Only the winning category matters here, so stop at the first
+    # priority hit instead of collecting every match
+    return _first_priority_match(match.group(1), keywords_dict)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Step 1 Guard C: Cross-reference Undergrupp (P) of other Cykel persons
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _try_undergrupp_p_cross_reference(
-    matches: list[str],
-    person_ug_p: Any,
-    other_persons_ug_p: list[Any],
-) -> list[str]:
-    """Filter out categories that likely belong to *another* Cykel person.
-
-    If *this* person's ``Undergrupp(P)`` is generic ("Cykel") but another
-    Cykel person in the same crash has a specific ``Undergrupp(P)`` matching
-    one of the keyword categories, the keyword mention likely belongs to that
-    *other* person.
-
-    Returns filtered matches, or the original list if no cross-reference is
-    possible.
-    """
-    if not matches or pd.isna(person_ug_p):
-        return matches
-
-    person_ug = str(person_ug_p).strip()
-
-    # Only apply if THIS person has a generic classification
-    if person_ug in SPECIFIC_UNDERGRUPP_P:
-        return matches
-
-    # Check if any OTHER person has a specific Undergrupp (P)
-    other_specific: set[str] = set()
-    for ug in other_persons_ug_p:
-        if pd.notna(ug) and str(ug).strip() in SPECIFIC_UNDERGRUPP_P:
-            other_specific.add(str(ug).strip())
-
-    if not other_specific:
-        return matches
-
-    # Map other persons' Undergrupp(P) → categories and exclude those
-    exclude_categories: set[str] = set()
-    for ug in other_specific:
-        mapped = UNDERGRUPP_MAP.get(ug)
-        if mapped and mapped in matches:
-            exclude_categories.add(mapped)
-
-    if exclude_categories:
-        return [m for m in matches if m not in exclude_categories]
-
-    return matches
+# A person whose own Undergrupp (P) is generic ("Cykel") has keyword
+# categories dropped when another Cykel person in the same crash has a
+# specific Undergrupp (P) mapping to them: the mention likely belongs to that
+# *other* person.  Specific Undergrupp (P) value → category bit it excludes.
+_SPECIFIC_UG_P_BITS: dict[str, int] = {
+    ug: _CATEGORY_BITS.get(UNDERGRUPP_MAP.get(ug), 0)
+    for ug in SPECIFIC_UNDERGRUPP_P
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Step 2 Guard B: I Konflikt med exclusion (hospital-only)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _apply_conflict_partner_exclusion(
-    matches: list[str],
-    konflikt_undergrupp: Any,
-) -> list[str]:
-    """Exclude categories when the conflict partner IS the matched type.
-
-    If this person's ``I Konflikt med - Undergrupp`` indicates that the
-    collision partner is (e.g.) an E-scooter, and the (S) narrative contains
-    E-scooter keywords, those keywords describe the *partner*, not this
-    person.
-    """
-    if not matches or pd.isna(konflikt_undergrupp):
-        return matches
-
-    konflikt = str(konflikt_undergrupp).strip()
-    exclude: set[str] = set()
-
-    for category, exclusion_values in CONFLICT_PARTNER_EXCLUSIONS.items():
-        if konflikt in exclusion_values and category in matches:
-            exclude.add(category)
-
-    if exclude:
-        return [m for m in matches if m not in exclude]
-
-    return matches
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# Helper: Undergrupp agreement check
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def _undergrupp_agrees(category: str, sammanvagd_ug: Any) -> bool:
-    """Return ``True`` if the Sammanvägd Undergrupp corroborates *category*."""
-    if pd.isna(sammanvagd_ug):
-        return False
-    return UNDERGRUPP_MAP.get(str(sammanvagd_ug).strip()) == category
+# When a person's "I Konflikt med - Undergrupp" says the collision partner is
+# (e.g.) an E-scooter, E-scooter keywords in the (S) narrative describe the
+# *partner*, not this person.  "I Konflikt med" value → category bits it
+# excludes (inverse of CONFLICT_PARTNER_EXCLUSIONS).
+_KONFLIKT_EXCLUDE_BITS: dict[str, int] = {
+    value: sum(
+        bit
+        for category, bit in _CATEGORY_BITS.items()
+        if value in CONFLICT_PARTNER_EXCLUSIONS.get(category, ())
+    )
+    for values in CONFLICT_PARTNER_EXCLUSIONS.values()
+    for value in values
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -273,9 +504,11 @@ def classify_micromobility(
       other_micromobility | Conventional bicycle | N/A
     * ``Classification_confidence`` — high | medium | low | default
     * ``Classification_step`` — which pipeline step produced the result
-    * ``_all_matches`` — (internal) all keyword categories found
+    * ``_match_mask`` — (internal) bitmask of all keyword categories found
 
-    Non-Cykel rows receive ``"N/A"`` for all classification columns.
+    The three labelled columns are categoricals with fixed categories.
+    Non-Cykel rows receive ``"N/A"`` as type and ``""`` for confidence and
+    step.
 
     Parameters
     ----------
@@ -289,173 +522,231 @@ def classify_micromobility(
     """
     stats = ClassificationStats()
 
-    # ── Initialise output columns ──────────────────────────────────────────
+    # ── Preallocate output columns ─────────────────────────────────────────
     df = df_personer
-    df["Micromobility_type"] = "N/A"
-    df["Classification_confidence"] = ""
-    df["Classification_step"] = ""
-    df["_all_matches"] = None
-    df["_all_matches"] = df["_all_matches"].astype(object)
-    for i in df.index:
-        df.at[i, "_all_matches"] = []
+    n_rows = len(df)
+    type_codes = np.full(n_rows, _TYPE_CODES["N/A"], dtype=np.int8)
+    confidence_codes = np.full(n_rows, _CONFIDENCE_CODES[""], dtype=np.int8)
+    step_codes = np.full(n_rows, _STEP_CODES[""], dtype=np.int8)
+    match_masks = np.zeros(n_rows, dtype=np.uint8)
 
     # ── Identify Cykel persons ─────────────────────────────────────────────
-    cykel_mask = df[COL_CATEGORY_MAIN] == CYKEL_CATEGORY
-    cykel_indices = df[cykel_mask].index
-    stats.total_cykel = len(cykel_indices)
-
-    # PRE-STEP: per-crash Cykel count
-    cykel_per_crash = df[cykel_mask].groupby(COL_CRASH_ID).size()
+    # Only Cykel rows are classified (everyone else keeps "N/A"), and only
+    # the columns the classifier reads are copied out for them
+    cykel_mask = (df[COL_CATEGORY_MAIN] == CYKEL_CATEGORY).to_numpy(dtype=bool)
+    used_cols = [
+        c for c in (
+            COL_CRASH_ID, COL_CATEGORY_SUB, COL_TE_NR_P, COL_CATEGORY_P,
+            COL_KONFLIKT_UG, COL_EVENT_P, COL_EVENT_S,
+        )
+        if c in df.columns
+    ]
+    df_cykel = df.loc[cykel_mask, used_cols]
+    stats.total_cykel = len(df_cykel)
+
+    # PRE-STEP: per-crash Cykel count.  Crash ids are factorized once (-1
+    # for a missing id); one bincount then gives every crash's size
+    crash_codes = pd.factorize(df_cykel[COL_CRASH_ID])[0]
+    cykel_per_crash = np.bincount(crash_codes[crash_codes >= 0])
+    is_multi_crash = cykel_per_crash > 1
     stats.solo_cykel_crashes = int((cykel_per_crash == 1).sum())
-    stats.multi_cykel_crashes = int((cykel_per_crash > 1).sum())
-    stats.multi_cykel_persons = int(
-        cykel_per_crash[cykel_per_crash > 1].sum()
+    stats.multi_cykel_crashes = int(is_multi_crash.sum())
+    stats.multi_cykel_persons = int(cykel_per_crash[is_multi_crash].sum())
+
+    # Missing crash ids count as solo, as no other person can share them
+    has_crash = crash_codes >= 0
+    solo = np.ones(len(crash_codes), dtype=bool)
+    solo[has_crash] = cykel_per_crash[crash_codes[has_crash]] == 1
+
+    # Lower-cased narratives and their keyword matches, computed column-wise.
+    # The lowered (P) text also feeds Guard B; missing columns read as empty.
+    empty = pd.Series(dtype=object)
+    lower_p = _lowered_narratives(
+        df_cykel[COL_EVENT_P] if COL_EVENT_P in df_cykel else empty
     )
+    mask_p_arr = _positional_masks(_match_keyword_column(lower_p), df_cykel.index)
 
-    # Pre-compute: crash → list of Cykel-person indices (for Guard C)
-    crash_cykel_groups = df[cykel_mask].groupby(COL_CRASH_ID).groups
-
-    # ── Classify each Cykel person ─────────────────────────────────────────
-    kw = MICROMOBILITY_KEYWORDS
-
-    for idx in cykel_indices:
-        row = df.loc[idx]
-        olycksnummer = row[COL_CRASH_ID]
-        n_cykel = cykel_per_crash.get(olycksnummer, 1)
-        is_solo = n_cykel == 1
-
-        text_p = row.get(COL_EVENT_P, "")
-        text_s = row.get(COL_EVENT_S, "")
-        has_p = pd.notna(text_p) and str(text_p).strip() != ""
-        has_s = pd.notna(text_s) and str(text_s).strip() != ""
-
-        sammanvagd_ug = row.get(COL_CATEGORY_SUB, "")
-        result: str | None = None
-        all_matches: list[str] = []
-        confidence = ""
-        step = ""
-
-        # ── STEP 1: (P) narrative with guards ─────────────────────────
-        if has_p and result is None:
-            matches_p = _find_keyword_matches(str(text_p), kw)
-
-            if matches_p:
-                if is_solo:
-                    # Guard A: solo Cykel — safe
-                    result = _resolve_priority(matches_p)
-                    all_matches = matches_p
-                    step = "Step 1 (P, solo)"
-                    stats.guard_counts["Step1_GuardA"] += 1
-                else:
-                    # Guard B: Trafikelement Nr
-                    te_nr = row.get(COL_TE_NR_P, "")
-                    guard_b = _try_trafikelement_disambiguation(
-                        str(text_p), te_nr, kw
-                    )
-                    if guard_b is not None:
-                        result = guard_b
-                        all_matches = matches_p
-                        step = "Step 1 (P, Guard B: TE Nr)"
-                        stats.guard_counts["Step1_GuardB"] += 1
-                    else:
-                        # Guard C: cross-ref other persons' Undergrupp(P)
-                        crash_indices = crash_cykel_groups.get(
-                            olycksnummer, []
-                        )
-                        other_ug_p = [
-                            df.at[oi, COL_CATEGORY_P]
-                            for oi in crash_indices
-                            if oi != idx
-                        ]
-                        person_ug_p = row.get(COL_CATEGORY_P, "")
-                        filtered = _try_undergrupp_p_cross_reference(
-                            matches_p, person_ug_p, other_ug_p
-                        )
-                        if filtered:
-                            result = _resolve_priority(filtered)
-                            all_matches = matches_p
-                            step = "Step 1 (P, Guard C: UG cross-ref)"
-                            stats.guard_counts["Step1_GuardC"] += 1
-                        else:
-                            # Guard D: can't disambiguate — fall through
-                            stats.guard_counts["Step1_GuardD"] += 1
-
-            if result is not None:
-                stats.step_counts["Step 1"] += 1
-
-        # ── STEP 2: (S) narrative with guards ─────────────────────────
-        if has_s and result is None:
-            matches_s = _find_keyword_matches(str(text_s), kw)
-
-            if matches_s:
-                if is_solo:
-                    # Guard A: solo — safe
-                    result = _resolve_priority(matches_s)
-                    all_matches = matches_s
-                    step = "Step 2 (S, solo)"
-                    stats.guard_counts["Step2_GuardA"] += 1
-                else:
-                    # Guard B: I Konflikt med exclusion
-                    konflikt_ug = row.get(COL_KONFLIKT_UG, "")
-                    filtered = _apply_conflict_partner_exclusion(
-                        matches_s, konflikt_ug
-                    )
-                    if filtered:
-                        if (
-                            pd.notna(konflikt_ug)
-                            and str(konflikt_ug).strip() != ""
-                        ):
-                            result = _resolve_priority(filtered)
-                            all_matches = matches_s
-                            step = "Step 2 (S, Guard B: I Konflikt med)"
-                            stats.guard_counts["Step2_GuardB"] += 1
-                        else:
-                            # Guard C: (S) is per-person → keyword likely
-                            # refers to this person
-                            result = _resolve_priority(filtered)
-                            all_matches = matches_s
-                            step = (
-                                "Step 2 (S, Guard C: per-person assumption)"
-                            )
-                            confidence = "medium"
-                            stats.guard_counts["Step2_GuardC"] += 1
-
-            if result is not None and step.startswith("Step 2"):
-                stats.step_counts["Step 2"] += 1
-
-        # ── STEP 3: Structured Undergrupp fallback ────────────────────
-        if result is None:
-            ug_val = (
-                str(sammanvagd_ug).strip()
-                if pd.notna(sammanvagd_ug)
-                else ""
-            )
-            mapped = UNDERGRUPP_MAP.get(ug_val)
-            if mapped and mapped != "Conventional bicycle":
-                result = mapped
-                step = "Step 3 (Undergrupp fallback)"
-                confidence = "low"
-                stats.step_counts["Step 3"] += 1
-
-        # ── STEP 4: Default ───────────────────────────────────────────
-        if result is None:
-            result = "Conventional bicycle"
-            step = "Step 4 (default)"
-            confidence = "default"
-            stats.step_counts["Step 4"] += 1
-
-        # ── Determine confidence if not yet set ───────────────────────
-        if confidence == "":
-            if _undergrupp_agrees(result, sammanvagd_ug):
-                confidence = "high"
-            else:
-                confidence = "medium"
-
-        # ── Write results ─────────────────────────────────────────────
-        df.at[idx, "Micromobility_type"] = result
-        df.at[idx, "Classification_confidence"] = confidence
-        df.at[idx, "Classification_step"] = step
-        df.at[idx, "_all_matches"] = all_matches
+    # A solo person whose (P) narrative matched is settled by Step 1, so
+    # their (S) narrative is neither lowered nor scanned
+    needs_s = ~(solo & (mask_p_arr != 0))
+    lower_s = _lowered_narratives(
+        df_cykel.loc[needs_s, COL_EVENT_S] if COL_EVENT_S in df_cykel else empty
+    )
+    mask_s_arr = _positional_masks(_match_keyword_column(lower_s), df_cykel.index)
+
+    # Structured columns, stripped once; optional columns absent from this
+    # export read as ""
+    row_frame = df_cykel.reindex(
+        columns=[COL_CATEGORY_SUB, COL_TE_NR_P, COL_CATEGORY_P, COL_KONFLIKT_UG],
+        fill_value="",
+    )
+    ug_sub = _stripped(row_frame[COL_CATEGORY_SUB])
+    ug_p = _stripped(row_frame[COL_CATEGORY_P])
+    konflikt_ug = _stripped(row_frame[COL_KONFLIKT_UG])
+    te_nrs = row_frame[COL_TE_NR_P].to_numpy(dtype=object)
+
+    # Type code the Sammanvägd Undergrupp maps to (-1: unmapped or missing)
+    ug_type_codes = (
+        pd.Series(ug_sub, dtype=object)
+        .map({ug: _TYPE_CODES[t] for ug, t in UNDERGRUPP_MAP.items()})
+        .fillna(-1)
+        .to_numpy(dtype=np.int8)
+    )
+
+    # Per-Cykel-row results; scattered into the full-length arrays at the end
+    n_cykel = len(df_cykel)
+    cyk_types = np.full(n_cykel, _TYPE_CODES["N/A"], dtype=np.int8)
+    cyk_confidences = np.full(n_cykel, _CONFIDENCE_CODES[""], dtype=np.int8)
+    cyk_steps = np.full(n_cykel, _STEP_CODES[""], dtype=np.int8)
+    cyk_masks = np.zeros(n_cykel, dtype=np.uint8)
+
+    # ── Guard A (solo Cykel crashes), resolved column-wise ─────────────────
+    solo_p = solo & (mask_p_arr != 0)
+    solo_s = solo & ~solo_p & (mask_s_arr != 0)
+
+    for hit, masks, step, step_key, guard_key in (
+        (solo_p, mask_p_arr, "Step 1 (P, solo)", "Step 1", "Step1_GuardA"),
+        (solo_s, mask_s_arr, "Step 2 (S, solo)", "Step 2", "Step2_GuardA"),
+    ):
+        n_hit = int(hit.sum())
+        stats.step_counts[step_key] += n_hit
+        stats.guard_counts[guard_key] += n_hit
+        cyk_types[hit] = _MASK_TYPE_CODES[masks[hit]]
+        cyk_steps[hit] = _STEP_CODES[step]
+        cyk_masks[hit] = masks[hit]
+
+    # ── STEP 1 Guards B–D: multi-Cykel persons with a (P) match ───────────
+    # Everything but Guard B's reference lookup is bit arithmetic on the
+    # category masks, so only Guard B still visits rows one by one
+    multi = ~solo
+    multi_p = multi & (mask_p_arr != 0)
+
+    # Guard B: Trafikelement Nr.  Every Cykel person of the crash shares the
+    # (P) text, so its references are found only once
+    guard_b_codes = np.full(n_cykel, -1, dtype=np.int8)
+    rows_b = np.flatnonzero(multi_p)
+    texts_p = lower_p.reindex(df_cykel.index[rows_b]).tolist()
+    anchors_by_text: dict[str, list[tuple[str, int]]] = {}
+    for local, text_p, te_nr in zip(rows_b, texts_p, te_nrs[rows_b]):
+        anchors = anchors_by_text.get(text_p)
+        if anchors is None:
+            anchors = anchors_by_text[text_p] = _reference_anchors(text_p)
+        guard_b = _try_trafikelement_disambiguation(
+            text_p, te_nr, MICROMOBILITY_KEYWORDS, anchors
+        )
+        if guard_b is not None:
+            guard_b_codes[local] = _TYPE_CODES[guard_b]
+    hit_b = guard_b_codes >= 0
+
+    # Guard C: cross-ref other persons' Undergrupp(P).  OR the specific
+    # Undergrupp (P) bits over each crash; a generic person's own bits are
+    # 0, so the crash total is exactly what the *other* persons contribute
+    ug_p_bits = (
+        pd.Series(ug_p, dtype=object)
+        .map(_SPECIFIC_UG_P_BITS)
+        .fillna(0)
+        .to_numpy(dtype=np.uint8)
+    )
+    crash_bits = np.zeros(len(cykel_per_crash), dtype=np.uint8)
+    np.bitwise_or.at(crash_bits, crash_codes[has_crash], ug_p_bits[has_crash])
+    generic_p = (
+        has_crash
+        & pd.notna(ug_p)
+        & ~pd.Series(ug_p, dtype=object).isin(SPECIFIC_UNDERGRUPP_P).to_numpy()
+    )
+    other_bits = np.zeros(n_cykel, dtype=np.uint8)
+    other_bits[generic_p] = crash_bits[crash_codes[generic_p]]
+    filtered_p = mask_p_arr & ~other_bits
+
+    rest_p = multi_p & ~hit_b
+    hit_c = rest_p & (filtered_p != 0)
+    # Guard D: can't disambiguate — fall through to Step 2
+    hit_d = rest_p & ~hit_c
+
+    cyk_types[hit_b] = guard_b_codes[hit_b]
+    cyk_steps[hit_b] = _STEP_CODES["Step 1 (P, Guard B: TE Nr)"]
+    cyk_types[hit_c] = _MASK_TYPE_CODES[filtered_p[hit_c]]
+    cyk_steps[hit_c] = _STEP_CODES["Step 1 (P, Guard C: UG cross-ref)"]
+    hit_p = hit_b | hit_c
+    cyk_masks[hit_p] = mask_p_arr[hit_p]
+
+    n_b, n_c = int(hit_b.sum()), int(hit_c.sum())
+    stats.guard_counts["Step1_GuardB"] += n_b
+    stats.guard_counts["Step1_GuardC"] += n_c
+    stats.guard_counts["Step1_GuardD"] += int(hit_d.sum())
+    stats.step_counts["Step 1"] += n_b + n_c
+
+    # ── STEP 2: (S) narrative with guards ─────────────────────────────────
+    # Guard B: I Konflikt med exclusion
+    konflikt = pd.Series(konflikt_ug, dtype=object)
+    exclude_bits = (
+        konflikt.map(_KONFLIKT_EXCLUDE_BITS).fillna(0).to_numpy(dtype=np.uint8)
+    )
+    filtered_s = mask_s_arr & ~exclude_bits
+    hit_s = multi & ~hit_p & (filtered_s != 0)
+    # Guard C: without an I Konflikt med value, (S) is per-person → the
+    # keyword likely refers to this person
+    has_konflikt = konflikt.fillna("").to_numpy(dtype=object) != ""
+    hit_s_b = hit_s & has_konflikt
+    hit_s_c = hit_s & ~has_konflikt
+
+    cyk_types[hit_s] = _MASK_TYPE_CODES[filtered_s[hit_s]]
+    cyk_masks[hit_s] = mask_s_arr[hit_s]
+    cyk_steps[hit_s_b] = _STEP_CODES["Step 2 (S, Guard B: I Konflikt med)"]
+    cyk_steps[hit_s_c] = _STEP_CODES["Step 2 (S, Guard C: per-person assumption)"]
+    cyk_confidences[hit_s_c] = _CONFIDENCE_CODES["medium"]
+
+    n_s_b, n_s_c = int(hit_s_b.sum()), int(hit_s_c.sum())
+    stats.guard_counts["Step2_GuardB"] += n_s_b
+    stats.guard_counts["Step2_GuardC"] += n_s_c
+    stats.step_counts["Step 2"] += n_s_b + n_s_c
+
+    # ── STEP 3: Structured Undergrupp fallback ────────────────────────────
+    unresolved = cyk_types == _TYPE_CODES["N/A"]
+    step3 = (
+        unresolved
+        & (ug_type_codes >= 0)
+        & (ug_type_codes != _TYPE_CODES["Conventional bicycle"])
+    )
+    cyk_types[step3] = ug_type_codes[step3]
+    cyk_steps[step3] = _STEP_CODES["Step 3 (Undergrupp fallback)"]
+    cyk_confidences[step3] = _CONFIDENCE_CODES["low"]
+    stats.step_counts["Step 3"] += int(step3.sum())
+
+    # ── STEP 4: Default ───────────────────────────────────────────────────
+    step4 = unresolved & ~step3
+    cyk_types[step4] = _TYPE_CODES["Conventional bicycle"]
+    cyk_steps[step4] = _STEP_CODES["Step 4 (default)"]
+    cyk_confidences[step4] = _CONFIDENCE_CODES["default"]
+    stats.step_counts["Step 4"] += int(step4.sum())
+
+    # ── Keyword results: high when the Sammanvägd Undergrupp agrees ───────
+    unset = cyk_confidences == _CONFIDENCE_CODES[""]
+    cyk_confidences[unset] = np.where(
+        ug_type_codes[unset] == cyk_types[unset],
+        _CONFIDENCE_CODES["high"],
+        _CONFIDENCE_CODES["medium"],
+    )
+
+    cykel_pos = np.flatnonzero(cykel_mask)
+    type_codes[cykel_pos] = cyk_types
+    confidence_codes[cykel_pos] = cyk_confidences
+    step_codes[cykel_pos] = cyk_steps
+    match_masks[cykel_pos] = cyk_masks
+
+    # Few possible labels: int8 codes throughout, so isin/equality in
+    # verify_classification compare codes instead of strings, and the
+    # per-row labels are not stored as separate Python strings
+    df["Micromobility_type"] = pd.Categorical.from_codes(
+        type_codes, categories=MICROMOBILITY_TYPES
+    )
+    df["Classification_confidence"] = pd.Categorical.from_codes(
+        confidence_codes, categories=_CONFIDENCE_LEVELS
+    )
+    df["Classification_step"] = pd.Categorical.from_codes(
+        step_codes, categories=_STEP_LABELS
+    )
+    df["_match_mask"] = match_masks
 
     return df, stats
 
@@ -464,6 +755,11 @@ def classify_micromobility(
 # Verification
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# isin() wants a list-like; convert the frozensets once rather than per call
+_ELECTRIC_TYPES: list[str] = ["E-scooter", "E-bike"]
+_ELECTRIC_UNDERGRUPP_VALUES: list[str] = sorted(ELECTRIC_UNDERGRUPP)
+
+
 def verify_classification(
     df_personer: pd.DataFrame,
 ) -> tuple[VerificationResult, VerificationResult, pd.DataFrame]:
@@ -476,22 +772,51 @@ def verify_classification(
         * result_2b: Conventional bicycle but Undergrupp = electric.
         * multi_matches: rows that matched multiple keyword categories.
     """
-    electric_types = {"E-scooter", "E-bike"}
+    detail_cols = [
+        COL_CRASH_ID,
+        "Micromobility_type",
+        COL_CATEGORY_SUB,
+        "Classification_confidence",
+        "Classification_step",
+    ]
+
+    # Each column is scanned once; both checks combine the same masks
+    mm_type = df_personer["Micromobility_type"]
+    is_electric_ug = (
+        df_personer[COL_CATEGORY_SUB].isin(_ELECTRIC_UNDERGRUPP_VALUES).to_numpy()
+    )
+    is_electric_type = mm_type.isin(_ELECTRIC_TYPES).to_numpy()
+    is_conventional = (mm_type == "Conventional bicycle").to_numpy()
 
     # CL.1 — electric classified without matching Undergrupp
-    mismatch_2a = df_personer[
-        df_personer["Micromobility_type"].isin(electric_types)
-        & ~df_personer[COL_CATEGORY_SUB].isin(ELECTRIC_UNDERGRUPP)
-    ][
-        [
-            COL_CRASH_ID,
-            "Micromobility_type",
-            COL_CATEGORY_SUB,
-            "Classification_confidence",
-            "Classification_step",
-        ]
+    mismatch_2a = df_personer.loc[
+        is_electric_type & ~is_electric_ug, detail_cols
+    ].copy()
+
+    # CL.2 — conventional bicycle with electric Undergrupp
+    mismatch_2b = df_personer.loc[
+        is_conventional & is_electric_ug, detail_cols
     ].copy()
 
+    res_2a, res_2b = _cl_results(mismatch_2a, mismatch_2b)
+
+    # Multi-category matches: more than one bit set, i.e. clearing the
+    # lowest set bit (mask & (mask - 1)) leaves something behind
+    match_mask = df_personer["_match_mask"].to_numpy()
+    is_multi = (match_mask & (match_mask - 1)) != 0
+    multi_out = df_personer.loc[is_multi, [COL_CRASH_ID, "Micromobility_type"]]
+    multi_out["_all_matches"] = [
+        list(_MASK_CATEGORIES[mask]) for mask in match_mask[is_multi]
+    ]
+
+    return res_2a, res_2b, multi_out
+
+
+def _cl_results(
+    mismatch_2a: pd.DataFrame,
+    mismatch_2b: pd.DataFrame,
+) -> tuple[VerificationResult, VerificationResult]:
+    """Build the CL.1 / CL.2 results from their mismatch rows."""
     res_2a = VerificationResult(
         check_id="CL.1",
         check_name="E-scooter/E-bike without matching Undergrupp",
@@ -505,20 +830,6 @@ def verify_classification(
         details=mismatch_2a if len(mismatch_2a) > 0 else None,
     )
 
-    # CL.2 — conventional bicycle with electric Undergrupp
-    mismatch_2b = df_personer[
-        (df_personer["Micromobility_type"] == "Conventional bicycle")
-        & df_personer[COL_CATEGORY_SUB].isin(ELECTRIC_UNDERGRUPP)
-    ][
-        [
-            COL_CRASH_ID,
-            "Micromobility_type",
-            COL_CATEGORY_SUB,
-            "Classification_confidence",
-            "Classification_step",
-        ]
-    ].copy()
-
     res_2b = VerificationResult(
         check_id="CL.2",
         check_name="Conventional bicycle with electric Undergrupp",
@@ -532,15 +843,7 @@ def verify_classification(
         details=mismatch_2b if len(mismatch_2b) > 0 else None,
     )
 
-    # Multi-category matches
-    multi = df_personer[
-        df_personer["_all_matches"].apply(lambda x: len(x) > 1)
-    ]
-    multi_out = multi[
-        [COL_CRASH_ID, "Micromobility_type", "_all_matches"]
-    ].copy()
-
-    return res_2a, res_2b, multi_out
+    return res_2a, res_2b
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -565,31 +868,37 @@ def add_conflict_partner(
     -------
     pd.DataFrame
     """
-    crash_categories = (
-        df_personer
-        .groupby(COL_CRASH_ID)[COL_CATEGORY_MAIN]
-        .apply(list)
-        .to_dict()
+    crash_ids = df_personer[COL_CRASH_ID]
+    categories = df_personer[COL_CATEGORY_MAIN]
+    is_cykel = categories == CYKEL_CATEGORY
+
+    # Every crash member except the Cykel person themself.  One Cykel entry
+    # per crash is dropped, so co-riding cyclists still list "Cykel".
+    first_cykel = is_cykel & (is_cykel.groupby(crash_ids).cumsum() == 1)
+    others = df_personer.loc[
+        crash_ids.notna() & ~first_cykel, [COL_CRASH_ID, COL_CATEGORY_MAIN]
+    ]
+    # Order-preserving de-duplication per crash through dict keys: one
+    # pass over plain Python values instead of a Series per crash group
+    known = others.dropna(subset=[COL_CATEGORY_MAIN])
+    unique_partners: dict[Any, dict[str, None]] = {}
+    for crash_id, category in zip(
+        known[COL_CRASH_ID].tolist(), known[COL_CATEGORY_MAIN].tolist()
+    ):
+        unique_partners.setdefault(crash_id, {})[category] = None
+    partners = pd.Series(
+        {crash_id: ", ".join(cats) for crash_id, cats in unique_partners.items()},
+        dtype=object,
     )
 
-    def _get_partners(row: pd.Series) -> str:
-        if row[COL_CATEGORY_MAIN] != CYKEL_CATEGORY:
-            return "N/A"
-        crash_id = row[COL_CRASH_ID]
-        all_cats = list(crash_categories.get(crash_id, []))
-        if CYKEL_CATEGORY in all_cats:
-            all_cats.remove(CYKEL_CATEGORY)
-        if not all_cats:
-            return "Single"
-        seen: list[str] = []
-        for c in all_cats:
-            if c not in seen and pd.notna(c):
-                seen.append(c)
-        return ", ".join(seen)
-
-    df_personer["Conflict_partner"] = df_personer.apply(
-        _get_partners, axis=1
-    )
+    conflict = crash_ids.map(partners).astype(object)
+    # Crashes whose other members all lack a category join to ""
+    conflict[conflict.isna() & crash_ids.isin(others[COL_CRASH_ID])] = ""
+    conflict = conflict.fillna("Single")
+    conflict[~is_cykel] = "N/A"
+
+    # Few distinct partner combinations per dataset → categorical codes
+    df_personer["Conflict_partner"] = conflict.astype("category")
     return df_personer
 
 
@@ -616,9 +925,125 @@ def run_classification_pipeline(
 
     # Clean up internal columns
     df.drop(
-        columns=["_all_matches"],
+        columns=["_match_mask"],
         inplace=True,
         errors="ignore",
     )
 
     return df, [res_2a, res_2b], multi, stats
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Chunked pipeline (streamed Personer)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _crash_aligned_chunks(
+    chunks: Iterable[pd.DataFrame],
+) -> Iterator[pd.DataFrame]:
+    """Re-cut *chunks* so that every crash lies inside a single chunk.
+
+    The trailing run of rows sharing the chunk's last ``Olycksnummer`` is
+    held back and prepended to the next chunk.  Row labels continue across
+    chunks, as in a full load.
+
+    Raises
+    ------
+    ValueError
+        If a crash's rows are not contiguous in the input, so that it would
+        still be split across chunks.
+    """
+    emitted: set = set()
+    offset = 0
+
+    def _emit(part: pd.DataFrame) -> pd.DataFrame:
+        nonlocal offset
+        crash_ids = set(part[COL_CRASH_ID].dropna().unique())
+        split = emitted & crash_ids
+        if split:
+            raise ValueError(
+                "Personer rows must be grouped by crash to classify in "
+                f"chunks; crash {next(iter(split))} is split across chunks."
+            )
+        emitted.update(crash_ids)
+        part.index = pd.RangeIndex(offset, offset + len(part))
+        offset += len(part)
+        return part
+
+    carry: pd.DataFrame | None = None
+    for chunk in chunks:
+        if carry is not None and len(carry) > 0:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        if len(chunk) == 0:
+            continue
+
+        crash_ids = chunk[COL_CRASH_ID].to_numpy()
+        last = crash_ids[-1]
+        cut = len(chunk)
+        while cut > 0 and crash_ids[cut - 1] == last:
+            cut -= 1
+
+        carry = chunk.iloc[cut:]
+        if cut > 0:
+            yield _emit(chunk.iloc[:cut].copy())
+
+    if carry is not None and len(carry) > 0:
+        yield _emit(carry.copy())
+
+
+def _concat_or_empty(parts: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    """Concatenate the non-empty *parts*, or return an empty frame."""
+    parts = [part for part in parts if len(part) > 0]
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(parts)
+
+
+def run_classification_pipeline_chunked(
+    personer_chunks: Iterable[pd.DataFrame],
+    on_chunk: Callable[[pd.DataFrame], None],
+) -> tuple[list[VerificationResult], pd.DataFrame, ClassificationStats]:
+    """Run :func:`run_classification_pipeline` over a streamed Personer table.
+
+    Classification and conflict partners only look within a crash, so each
+    crash-aligned chunk is processed on its own and handed to *on_chunk*
+    (e.g. to append it to an output CSV) before the next one is read.  Peak
+    memory is bounded by one chunk rather than the whole table.
+
+    Parameters
+    ----------
+    personer_chunks : iterable of pd.DataFrame
+        Consecutive blocks of the Personer table (e.g. from
+        :func:`strada.io.readers.iter_csv`).  Rows of one crash must be
+        contiguous, as in STRADA exports.
+    on_chunk : callable
+        Receives each classified chunk, in input order.
+
+    Returns
+    -------
+    (verification_results, multi_matches, stats)
+        As in :func:`run_classification_pipeline`, accumulated over all
+        chunks.
+    """
+    stats = ClassificationStats()
+    mismatch_2a: list[pd.DataFrame] = []
+    mismatch_2b: list[pd.DataFrame] = []
+    multi_parts: list[pd.DataFrame] = []
+
+    for chunk in _crash_aligned_chunks(personer_chunks):
+        df, (res_2a, res_2b), multi, chunk_stats = run_classification_pipeline(chunk)
+        stats.merge(chunk_stats)
+        if res_2a.details is not None:
+            mismatch_2a.append(res_2a.details)
+        if res_2b.details is not None:
+            mismatch_2b.append(res_2b.details)
+        multi_parts.append(multi)
+        on_chunk(df)
+
+    res_2a, res_2b = _cl_results(
+        _concat_or_empty(mismatch_2a, []),
+        _concat_or_empty(mismatch_2b, []),
+    )
+    multi = _concat_or_empty(
+        multi_parts, [COL_CRASH_ID, "Micromobility_type", "_all_matches"]
+    )
+    return [res_2a, res_2b], multi, stats
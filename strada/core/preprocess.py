@@ -8,13 +8,19 @@ This module handles:
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from strada.config.constants import COL_YEAR, CSV_ENCODING
-from strada.io.readers import load_csv, load_excel_sheet, save_csv
+from strada.config.constants import COL_YEAR
+from strada.io.readers import load_excel_sheets, save_table_csv
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -33,7 +39,8 @@ def convert_excel_to_csv(
     """Convert STRADA Excel workbook sheets to CSV files.
 
     In-cell line breaks are replaced by spaces during conversion so that the
-    resulting CSVs are safe for downstream processing.
+    resulting CSVs are safe for downstream processing.  The CSVs are written
+    through Arrow, in the same format as the web app's Preprocess download.
 
     Parameters
     ----------
@@ -54,15 +61,46 @@ def convert_excel_to_csv(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    df_olyckor = load_excel_sheet(excel_path, olyckor_sheet)
-    olyckor_csv = save_csv(df_olyckor, output_dir / olyckor_name)
-
-    df_personer = load_excel_sheet(excel_path, personer_sheet)
-    personer_csv = save_csv(df_personer, output_dir / personer_name)
+    tables = _load_sheet_tables(excel_path, [olyckor_sheet, personer_sheet])
+    olyckor_csv, personer_csv = _per_sheet(
+        save_table_csv,
+        (tables[olyckor_sheet], output_dir / olyckor_name),
+        (tables[personer_sheet], output_dir / personer_name),
+    )
 
     return olyckor_csv, personer_csv
 
 
+def _per_sheet(func: Callable[..., Any], *calls: tuple) -> list[Any]:
+    """Return ``[func(*args) for args in calls]``, one call per sheet.
+
+    Used for writing the Olyckor and Personer tables, which are independent.
+    On multi-core machines the calls run in parallel threads: the CSV writer
+    formats columns with Arrow compute kernels and the Parquet writer
+    encodes in C++, both of which release the GIL.  The sheets themselves
+    are read by :func:`~strada.io.readers.load_excel_sheets`, which has its
+    own per-sheet threads.
+    """
+    max_workers = min(len(calls), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [ex.submit(func, *args) for args in calls]
+            return [fut.result() for fut in futures]
+    return [func(*args) for args in calls]
+
+
+def _load_sheet_tables(
+    excel_path: Path,
+    sheet_names: list[str],
+) -> dict[str, pa.Table]:
+    """Read workbook sheets (line breaks cleaned) as Arrow tables."""
+    sheets = load_excel_sheets(excel_path, sheet_names)
+    return {
+        name: pa.Table.from_pandas(df, preserve_index=False)
+        for name, df in sheets.items()
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Year-range filtering
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -86,10 +124,64 @@ def filter_by_year(
 
     Returns
     -------
-    pd.DataFrame — filtered copy.
+    pd.DataFrame — the selected rows (a new frame).
+    """
+    # Boolean indexing already returns new data, so no extra copy is made
+    years = df[year_col].to_numpy()
+    mask = np.logical_and(years >= start_year, years <= end_year)
+    return df.loc[mask]
+
+
+def filter_table_by_year(
+    table: pa.Table,
+    start_year: int,
+    end_year: int,
+    *,
+    year_col: str = COL_YEAR,
+) -> pa.Table:
+    """Arrow counterpart of :func:`filter_by_year`.
+
+    The filter runs in Arrow compute and only gathers the selected rows, so
+    no intermediate DataFrame is built.  Rows with a missing year are
+    dropped, as in :func:`filter_by_year`.
+
+    Parameters
+    ----------
+    table : pa.Table
+    start_year, end_year : int
+        Inclusive bounds.
+    year_col : str
+        Name of the year column.
+
+    Returns
+    -------
+    pa.Table — filtered table.
     """
-    mask = (df[year_col] >= start_year) & (df[year_col] <= end_year)
-    return df.loc[mask].copy()
+    years = table[year_col]
+    mask = pc.and_(
+        pc.greater_equal(years, start_year),
+        pc.less_equal(years, end_year),
+    )
+    return table.filter(mask)
+
+
+def _save_csv_output(table: pa.Table, stem: Path) -> Path:
+    """Write *table* to ``<stem>.csv``."""
+    return save_table_csv(table, stem.with_name(stem.name + ".csv"))
+
+
+def _save_parquet_output(table: pa.Table, stem: Path) -> Path:
+    """Write *table* to ``<stem>.parquet`` (zstd-compressed)."""
+    path = stem.with_name(stem.name + ".parquet")
+    pq.write_table(table, path, compression="zstd")
+    return path
+
+
+# Output format → writer taking (table, output path without extension)
+_OUTPUT_WRITERS: dict[str, Callable[[pa.Table, Path], Path]] = {
+    "csv": _save_csv_output,
+    "parquet": _save_parquet_output,
+}
 
 
 def preprocess_pipeline(
@@ -100,6 +192,7 @@ def preprocess_pipeline(
     end_year: Optional[int] = None,
     olyckor_sheet: str = "Olyckor",
     personer_sheet: str = "Personer",
+    fmt: str = "csv",
 ) -> dict[str, Path | int]:
     """Full preprocessing pipeline: Excel → CSV → optional year filter.
 
@@ -111,6 +204,11 @@ def preprocess_pipeline(
         If both are provided the data is additionally filtered and saved
         with a ``-{start_year}-{end_year}`` suffix.
     olyckor_sheet, personer_sheet : str
+    fmt : {"csv", "parquet"}
+        Output format.  ``"parquet"`` writes zstd-compressed Parquet files
+        (``.parquet``), which keep column types and load much faster than
+        CSV in pandas, R or DuckDB.  The result keys keep their ``_csv``
+        names either way.
 
     Returns
     -------
@@ -120,40 +218,52 @@ def preprocess_pipeline(
         and optionally ``olyckor_filtered_csv``, ``personer_filtered_csv``,
         ``olyckor_filtered_count``, ``personer_filtered_count``.
     """
+    if fmt not in _OUTPUT_WRITERS:
+        raise ValueError(
+            f"Unknown output format {fmt!r}; expected one of "
+            f"{', '.join(_OUTPUT_WRITERS)}"
+        )
+    save = _OUTPUT_WRITERS[fmt]
+
+    excel_path = Path(excel_path)
     output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Step 1 — convert
-    olyckor_csv, personer_csv = convert_excel_to_csv(
-        excel_path,
-        output_dir,
-        olyckor_sheet=olyckor_sheet,
-        personer_sheet=personer_sheet,
+    # Step 1 — convert.  The sheets stay in memory as Arrow tables for the
+    # counts and the filter, rather than re-reading the CSVs just written.
+    tables = _load_sheet_tables(excel_path, [olyckor_sheet, personer_sheet])
+    tbl_olyckor = tables[olyckor_sheet]
+    tbl_personer = tables[personer_sheet]
+    olyckor_csv, personer_csv = _per_sheet(
+        save,
+        (tbl_olyckor, output_dir / "Olyckor"),
+        (tbl_personer, output_dir / "Personer"),
     )
 
-    df_olyckor = load_csv(olyckor_csv)
-    df_personer = load_csv(personer_csv)
-
     result: dict[str, Path | int] = {
         "olyckor_csv": olyckor_csv,
         "personer_csv": personer_csv,
-        "olyckor_count": len(df_olyckor),
-        "personer_count": len(df_personer),
+        "olyckor_count": tbl_olyckor.num_rows,
+        "personer_count": tbl_personer.num_rows,
     }
 
     # Step 2 — optional year filter
     if start_year is not None and end_year is not None:
-        df_olyckor_f = filter_by_year(df_olyckor, start_year, end_year)
-        df_personer_f = filter_by_year(df_personer, start_year, end_year)
+        tbl_olyckor_f = filter_table_by_year(tbl_olyckor, start_year, end_year)
+        tbl_personer_f = filter_table_by_year(tbl_personer, start_year, end_year)
 
         suffix = f"-{start_year}-{end_year}"
-        olyckor_f_csv = save_csv(df_olyckor_f, output_dir / f"Olyckor{suffix}.csv")
-        personer_f_csv = save_csv(df_personer_f, output_dir / f"Personer{suffix}.csv")
+        olyckor_f_csv, personer_f_csv = _per_sheet(
+            save,
+            (tbl_olyckor_f, output_dir / f"Olyckor{suffix}"),
+            (tbl_personer_f, output_dir / f"Personer{suffix}"),
+        )
 
         result.update({
             "olyckor_filtered_csv": olyckor_f_csv,
             "personer_filtered_csv": personer_f_csv,
-            "olyckor_filtered_count": len(df_olyckor_f),
-            "personer_filtered_count": len(df_personer_f),
+            "olyckor_filtered_count": tbl_olyckor_f.num_rows,
+            "personer_filtered_count": tbl_personer_f.num_rows,
         })
 
     return result
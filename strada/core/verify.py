@@ -19,6 +19,11 @@ Every public ``check_*`` function follows the same contract:
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable
+
 import pandas as pd
 import numpy as np
 
@@ -48,6 +53,34 @@ from strada.config.constants import (
 )
 from strada.io.reporters import VerificationResult
 
+CheckFunc = Callable[[pd.DataFrame, pd.DataFrame], VerificationResult]
+
+# Columns the checks read; pass as ``columns=`` to the CSV readers so the
+# remaining columns (free-text narratives etc.) are never parsed
+OLYCKOR_COLUMNS = [COL_CRASH_ID, COL_CRASH_TYPE]
+PERSONER_COLUMNS = [
+    COL_CRASH_ID,
+    COL_CRASH_TYPE,
+    COL_YEAR,
+    COL_MONTH,
+    COL_DAY,
+    COL_TIME,
+    COL_AGE,
+    COL_GENDER,
+    COL_COUNTY,
+    COL_MUNICIPALITY,
+    COL_STREET,
+    COL_CATEGORY_MAIN,
+    COL_CATEGORY_SUB,
+    COL_CATEGORY_P,
+    COL_CATEGORY_S,
+    COL_ROLE_P,
+    COL_ROLE_S,
+]
+
+# Any passenger role, as one alternation (C3)
+_PASSENGER_PATTERN = "|".join(re.escape(role) for role in PASSENGER_ROLES)
+
 
 # ╔═══════════════════════════════════════════════════════════════════════════╗
 # ║  GENERIC CHECKS  (G1 – G6)                                             ║
@@ -63,20 +96,31 @@ def check_g1_id_consistency(
     Verifies that every ``Olycksnummer`` in Olyckor has at least one
     corresponding row in Personer and vice-versa.
     """
-    olyckor_ids = set(df_olyckor[COL_CRASH_ID].unique())
-    personer_ids = set(df_personer[COL_CRASH_ID].unique())
+    return _g1_result(
+        df_olyckor[COL_CRASH_ID].unique(),
+        df_personer[COL_CRASH_ID].unique(),
+    )
 
-    olyckor_only = sorted(olyckor_ids - personer_ids)
-    personer_only = sorted(personer_ids - olyckor_ids)
 
-    rows = []
-    for cid in olyckor_only:
-        rows.append({"Olycksnummer": cid, "Found_in": "Olyckor only"})
-    for cid in personer_only:
-        rows.append({"Olycksnummer": cid, "Found_in": "Personer only"})
+def _g1_result(olyckor_ids: np.ndarray, personer_ids: np.ndarray) -> VerificationResult:
+    """Build the G1 result from the crash IDs of both tables.
+
+    *olyckor_ids* are distinct; *personer_ids* may repeat (e.g. when
+    gathered from several blocks), as ``np.setdiff1d`` dedups and sorts.
+    """
+    olyckor_only = np.setdiff1d(olyckor_ids, personer_ids)
+    personer_only = np.setdiff1d(personer_ids, olyckor_ids)
+
+    rows = pd.DataFrame({
+        "Olycksnummer": np.concatenate([olyckor_only, personer_only]),
+        "Found_in": (
+            ["Olyckor only"] * len(olyckor_only)
+            + ["Personer only"] * len(personer_only)
+        ),
+    })
 
-    details = pd.DataFrame(rows) if rows else None
     n_issues = len(rows)
+    details = rows if n_issues else None
 
     if n_issues == 0:
         summary = (
@@ -146,7 +190,8 @@ def check_g2_crash_type(
     ))
 
     # --- G2.2 — mismatch between datasets ---
-    # Take one Olyckstyp per crash from Personer (they should all agree)
+    # Take one Olyckstyp per crash from Personer (they should all agree).
+    # Olyckor may repeat a crash ID, so only the Personer side is unique.
     personer_types = (
         df_personer[[COL_CRASH_ID, COL_CRASH_TYPE]]
         .drop_duplicates(COL_CRASH_ID)
@@ -154,6 +199,8 @@ def check_g2_crash_type(
     merged = df_olyckor[[COL_CRASH_ID, COL_CRASH_TYPE]].merge(
         personer_types,
         on=COL_CRASH_ID,
+        how="inner",
+        validate="m:1",
         suffixes=("_olyckor", "_personer"),
     )
     col_o = f"{COL_CRASH_TYPE}_olyckor"
@@ -202,18 +249,119 @@ def check_g3_road_user_category(
       * G3.3  Filled P/S ≠ Sammanvägd.
       * G3.4  Neither P nor S matches Sammanvägd when both filled.
     """
-    sub_results = []
+    return _g3_result([_g3_partial(df_personer)])
+
+
+def _g3_empty(series: pd.Series) -> pd.Series:
+    return series.isna() | (series.astype(str).str.strip() == "")
+
+
+def _g3_startswith(values: pd.Series, prefixes: pd.Series) -> np.ndarray:
+    """Row-wise ``str(value).startswith(str(prefix))`` as a boolean array.
+
+    Runs in NumPy's C string kernels rather than a per-row Python lambda.
+    """
+    return np.char.startswith(
+        values.to_numpy(dtype=object).astype(str),
+        prefixes.to_numpy(dtype=object).astype(str),
+    )
+
+
+def _g3_partial(df_personer: pd.DataFrame) -> dict:
+    """Row-level G3 findings for one block of Personer rows.
+
+    G3 only compares columns within a row, so the findings of consecutive
+    blocks can be concatenated by :func:`_g3_result`.
+    """
     col_p = COL_CATEGORY_P
     col_s = COL_CATEGORY_S
     col_sam = COL_CATEGORY_SUB
 
-    def _empty(series):
-        return series.isna() | (series.astype(str).str.strip() == "")
+    # Emptiness of each category column, computed once for all sub-checks
+    empty_p = _g3_empty(df_personer[col_p]).to_numpy(dtype=bool)
+    empty_s = _g3_empty(df_personer[col_s]).to_numpy(dtype=bool)
+    empty_sam = _g3_empty(df_personer[col_sam]).to_numpy(dtype=bool)
+
+    # --- G3.1 — all three missing ---
+    all_missing = df_personer.loc[empty_p & empty_s & empty_sam, [COL_CRASH_ID]]
+
+    # --- G3.2 — P ≠ S when both filled ---
+    is_both_filled = ~empty_p & ~empty_s
+    both_filled = df_personer.loc[is_both_filled, [COL_CRASH_ID, col_p, col_s]]
+    if len(both_filled) > 0:
+        mismatched_ps = both_filled[both_filled[col_p] != both_filled[col_s]]
+    else:
+        mismatched_ps = pd.DataFrame()
+    n32 = len(mismatched_ps)
+
+    # --- G3.3 — filled P or S ≠ Sammanvägd ---
+    # Exclude rows already flagged in G3.2
+    if n32 > 0:
+        in_check = ~df_personer.index.isin(mismatched_ps.index)
+    else:
+        in_check = np.ones(len(df_personer), dtype=bool)
+
+    # Get the "effective" category: P if available, else S.  It is filled
+    # whenever P or S is
+    eff_cat = df_personer[col_p].where(~empty_p, df_personer[col_s])
+    has_eff_sam = in_check & (~empty_p | ~empty_s) & ~empty_sam
+    comparable = df_personer.loc[has_eff_sam, [COL_CRASH_ID, col_sam]].assign(
+        _eff=eff_cat[has_eff_sam]
+    )
+
+    # Smart match: exact OR eff starts with sam
+    exact_match = comparable["_eff"] == comparable[col_sam]
+    prefix_match = _g3_startswith(comparable["_eff"], comparable[col_sam])
+    mismatch_33 = comparable.loc[
+        ~exact_match & ~prefix_match, [COL_CRASH_ID, "_eff", col_sam]
+    ].rename(
+        columns={"_eff": "Filled_category"}
+    )
+
+    # --- G3.4 — neither P nor S matches Sammanvägd when both filled ---
+    if len(both_filled) > 0:
+        bf_sam = df_personer.loc[
+            is_both_filled & ~empty_sam, [COL_CRASH_ID, col_p, col_s, col_sam]
+        ]
+        if len(bf_sam) > 0:
+            p_exact = bf_sam[col_p] == bf_sam[col_sam]
+            s_exact = bf_sam[col_s] == bf_sam[col_sam]
+            p_prefix = _g3_startswith(bf_sam[col_p], bf_sam[col_sam])
+            s_prefix = _g3_startswith(bf_sam[col_s], bf_sam[col_sam])
+            neither = ~(p_exact | s_exact | p_prefix | s_prefix)
+            mismatch_34 = bf_sam[neither]
+        else:
+            mismatch_34 = pd.DataFrame()
+    else:
+        mismatch_34 = pd.DataFrame()
+
+    return {
+        "all_missing": all_missing,
+        "n_both_filled": len(both_filled),
+        "mismatch_32": mismatched_ps if n32 > 0 else None,
+        "mismatch_33": mismatch_33,
+        "mismatch_34": mismatch_34,
+    }
+
+
+def _concat_parts(parts: list) -> pd.DataFrame:
+    """Concatenate per-block frames, skipping empty ones."""
+    frames = [f for f in parts if f is not None and len(f) > 0]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].copy()
+    return pd.concat(frames)
+
+
+def _g3_result(partials: list[dict]) -> VerificationResult:
+    """Merge the per-block G3 findings into the G3 result."""
+    sub_results = []
 
     # --- G3.1 — all three missing ---
-    all_missing = df_personer[_empty(df_personer[col_p]) & _empty(df_personer[col_s]) & _empty(df_personer[col_sam])]
+    all_missing = _concat_parts([p["all_missing"] for p in partials])
     n31 = len(all_missing)
-    details31 = all_missing[[COL_CRASH_ID]].drop_duplicates() if n31 > 0 else None
+    details31 = all_missing.drop_duplicates() if n31 > 0 else None
     sub_results.append(VerificationResult(
         check_id="G3.1",
         check_name="All three Trafikantkategori columns missing",
@@ -224,53 +372,24 @@ def check_g3_road_user_category(
     ))
 
     # --- G3.2 — P ≠ S when both filled ---
-    both_filled = df_personer[~_empty(df_personer[col_p]) & ~_empty(df_personer[col_s])]
-    if len(both_filled) > 0:
-        mismatched_ps = both_filled[both_filled[col_p] != both_filled[col_s]]
-    else:
-        mismatched_ps = pd.DataFrame()
-    n32 = len(mismatched_ps)
-    details32 = mismatched_ps[[COL_CRASH_ID, col_p, col_s]].copy() if n32 > 0 else None
+    n_both_filled = sum(p["n_both_filled"] for p in partials)
+    mismatch_32 = _concat_parts([p["mismatch_32"] for p in partials])
+    n32 = len(mismatch_32)
     sub_results.append(VerificationResult(
         check_id="G3.2",
         check_name="P and S categories mismatch when both filled",
         status="pass" if n32 == 0 else "warning",
         summary=(
-            f"✓ All {len(both_filled)} persons with both P and S filled have matching values"
+            f"✓ All {n_both_filled} persons with both P and S filled have matching values"
             if n32 == 0
             else f"⚠ {n32} persons where P ≠ S"
         ),
         issue_count=n32,
-        details=details32,
+        details=mismatch_32 if n32 > 0 else None,
     ))
 
     # --- G3.3 — filled P or S ≠ Sammanvägd ---
-    # Exclude rows already flagged in G3.2
-    if n32 > 0:
-        df_check = df_personer.drop(mismatched_ps.index)
-    else:
-        df_check = df_personer
-
-    # Get the "effective" category: P if available, else S
-    eff_cat = df_check[col_p].where(~_empty(df_check[col_p]), df_check[col_s])
-    has_eff = ~_empty(eff_cat)
-    has_sam = ~_empty(df_check[col_sam])
-    comparable = df_check[has_eff & has_sam].copy()
-    comparable["_eff"] = eff_cat[has_eff & has_sam]
-
-    # Smart match: exact OR eff starts with sam
-    exact_match = comparable["_eff"] == comparable[col_sam]
-    prefix_match = comparable["_eff"].astype(str).apply(
-        lambda x: any(x.startswith(str(s)) for s in comparable[col_sam])
-    )
-    # Vectorised prefix match
-    prefix_match = comparable.apply(
-        lambda row: str(row["_eff"]).startswith(str(row[col_sam])), axis=1
-    )
-    mismatch_33 = comparable[~exact_match & ~prefix_match].copy()
-    mismatch_33 = mismatch_33[[COL_CRASH_ID, "_eff", col_sam]].rename(
-        columns={"_eff": "Filled_category"}
-    )
+    mismatch_33 = _concat_parts([p["mismatch_33"] for p in partials])
     n33 = len(mismatch_33)
     sub_results.append(VerificationResult(
         check_id="G3.3",
@@ -286,22 +405,7 @@ def check_g3_road_user_category(
     ))
 
     # --- G3.4 — neither P nor S matches Sammanvägd when both filled ---
-    rows_34 = []
-    if len(both_filled) > 0:
-        bf = both_filled.copy()
-        bf_sam = bf[~_empty(bf[col_sam])].copy()
-        if len(bf_sam) > 0:
-            p_exact = bf_sam[col_p] == bf_sam[col_sam]
-            s_exact = bf_sam[col_s] == bf_sam[col_sam]
-            p_prefix = bf_sam.apply(lambda r: str(r[col_p]).startswith(str(r[col_sam])), axis=1)
-            s_prefix = bf_sam.apply(lambda r: str(r[col_s]).startswith(str(r[col_sam])), axis=1)
-            neither = ~(p_exact | s_exact | p_prefix | s_prefix)
-            mismatch_34 = bf_sam[neither][[COL_CRASH_ID, col_p, col_s, col_sam]].copy()
-        else:
-            mismatch_34 = pd.DataFrame()
-    else:
-        mismatch_34 = pd.DataFrame()
-
+    mismatch_34 = _concat_parts([p["mismatch_34"] for p in partials])
     n34 = len(mismatch_34)
     sub_results.append(VerificationResult(
         check_id="G3.4",
@@ -327,9 +431,47 @@ def check_g3_road_user_category(
     )
 
 
+# Per-crash aggregates read by G4, G5 and C2, keyed by check ID: the
+# columns whose distinct values are counted, and whether Cykel presence
+# is needed
+_CRASH_SUMMARY_COLS: dict[str, tuple[str, ...]] = {
+    "G4": (COL_YEAR, COL_MONTH, COL_DAY, COL_TIME),
+    "G5": (COL_COUNTY, COL_MUNICIPALITY),
+    "C2": (),
+}
+
+
+def _crash_level_summary(
+    df_personer: pd.DataFrame,
+    nunique_cols: Iterable[str] = (),
+    *,
+    cykel: bool = False,
+) -> pd.DataFrame:
+    """Per-crash aggregates of Personer from a single groupby pass.
+
+    Returns one row per ``Olycksnummer`` (sorted, missing IDs dropped) with
+    the number of distinct non-missing values of each of *nunique_cols*
+    (columns named as in Personer), plus ``has_cykel`` if *cykel* is set.
+    :func:`run_checks` computes it once for G4, G5 and C2 together.
+    """
+    nunique_cols = list(dict.fromkeys(nunique_cols))
+    frame = df_personer[[COL_CRASH_ID, *nunique_cols]]
+    if cykel:
+        frame = frame.assign(
+            has_cykel=(df_personer[COL_CATEGORY_MAIN] == CYKEL_CATEGORY).to_numpy()
+        )
+    grouped = frame.groupby(COL_CRASH_ID)
+    summary = grouped[nunique_cols].nunique()
+    if cykel:
+        summary["has_cykel"] = grouped["has_cykel"].any()
+    return summary
+
+
 def check_g4_timeline(
     df_olyckor: pd.DataFrame | None,
     df_personer: pd.DataFrame,
+    *,
+    crash_summary: pd.DataFrame | None = None,
 ) -> VerificationResult:
     """**G4 — Crash timeline consistency** within each crash.
 
@@ -337,58 +479,58 @@ def check_g4_timeline(
     ``År``, ``Månad``, ``Dag`` are identical and that ``Klockslag grupp (timme)``
     is identical.  Date mismatches are reported first, then time mismatches
     sorted by the magnitude of the difference.
+
+    *crash_summary* may pass in a precomputed :func:`_crash_level_summary`
+    covering the date and time columns.
     """
     date_cols = [COL_YEAR, COL_MONTH, COL_DAY]
+    if crash_summary is None:
+        crash_summary = _crash_level_summary(df_personer, _CRASH_SUMMARY_COLS["G4"])
 
-    # Only look at multi-person crashes
-    counts = df_personer.groupby(COL_CRASH_ID).size()
-    multi = counts[counts > 1].index
-    df_multi = df_personer[df_personer[COL_CRASH_ID].isin(multi)]
-
-    # Date uniqueness per crash
-    date_nuniq = df_multi.groupby(COL_CRASH_ID)[date_cols].nunique()
-    date_bad_mask = (date_nuniq > 1).any(axis=1)
-    date_bad_ids = date_nuniq[date_bad_mask].index
+    # Date uniqueness per crash.  Only multi-person crashes can hold two
+    # distinct values, so no separate multi-person filter is needed.
+    date_bad_mask = (crash_summary[date_cols] > 1).any(axis=1)
+    date_bad_ids = crash_summary.index[date_bad_mask]
 
     # Time uniqueness per crash (only for crashes with consistent dates)
-    time_nuniq = df_multi.groupby(COL_CRASH_ID)[COL_TIME].nunique()
-    time_bad_mask = (time_nuniq > 1) & ~time_nuniq.index.isin(date_bad_ids)
-    time_bad_ids = time_nuniq[time_bad_mask].index
-
-    rows = []
-    for cid in date_bad_ids:
-        crash = df_multi[df_multi[COL_CRASH_ID] == cid]
-        dates = crash[date_cols].drop_duplicates()
-        vals = [f"{r[COL_YEAR]}-{r[COL_MONTH]}-{r[COL_DAY]}" for _, r in dates.iterrows()]
-        rows.append({
-            "Olycksnummer": cid,
-            "Reason": "Date mismatch",
-            "Details": ", ".join(vals),
-        })
+    time_bad_mask = (crash_summary[COL_TIME] > 1) & ~date_bad_mask
+    time_bad_ids = crash_summary.index[time_bad_mask]
+
+    # Date issues — the distinct dates of each crash, in order of first
+    # appearance.  The three columns are read as one array, so they share a
+    # common dtype (an int year prints as a float if Dag has gaps).
+    dates = df_personer.loc[
+        df_personer[COL_CRASH_ID].isin(date_bad_ids), [COL_CRASH_ID, *date_cols]
+    ].drop_duplicates()
+    date_labels = pd.Series(
+        [f"{y}-{m}-{d}" for y, m, d in dates[date_cols].to_numpy()],
+        index=dates.index,
+    )
+    date_details = date_labels.groupby(dates[COL_CRASH_ID]).agg(", ".join)
 
     # Time issues — compute difference for sorting
-    time_rows = []
-    for cid in time_bad_ids:
-        crash = df_multi[df_multi[COL_CRASH_ID] == cid]
-        times = crash[COL_TIME].dropna().unique()
-        try:
-            nums = [float(t) for t in times]
-            diff = max(nums) - min(nums)
-        except (ValueError, TypeError):
-            diff = 0
-        time_rows.append({
-            "Olycksnummer": cid,
-            "Reason": "Time mismatch",
-            "Details": ", ".join(str(t) for t in times),
-            "_diff": diff,
-        })
-    time_rows.sort(key=lambda x: x["_diff"], reverse=True)
-    for r in time_rows:
-        r.pop("_diff")
-    rows.extend(time_rows)
+    times = df_personer.loc[
+        df_personer[COL_CRASH_ID].isin(time_bad_ids), [COL_CRASH_ID, COL_TIME]
+    ].dropna(subset=[COL_TIME]).drop_duplicates()
+    time_crash = times[COL_CRASH_ID]
+    time_details = times[COL_TIME].map(str).groupby(time_crash).agg(", ".join)
+    # Spread between the earliest and latest hour; 0 if any is not numeric
+    hours = pd.to_numeric(times[COL_TIME], errors="coerce").groupby(time_crash)
+    spread = (hours.max() - hours.min()).where(hours.count() == hours.size(), 0)
+    by_spread = np.argsort(-spread.to_numpy(dtype=float), kind="stable")
+    time_details = time_details.iloc[by_spread]
+
+    rows = pd.DataFrame({
+        "Olycksnummer": [*date_details.index, *time_details.index],
+        "Reason": (
+            ["Date mismatch"] * len(date_details)
+            + ["Time mismatch"] * len(time_details)
+        ),
+        "Details": [*date_details, *time_details],
+    })
 
-    details = pd.DataFrame(rows) if rows else None
     n = len(rows)
+    details = rows if n else None
     n_date = len(date_bad_ids)
     n_time = len(time_bad_ids)
 
@@ -410,41 +552,55 @@ def check_g4_timeline(
 def check_g5_location(
     df_olyckor: pd.DataFrame | None,
     df_personer: pd.DataFrame,
+    *,
+    crash_summary: pd.DataFrame | None = None,
 ) -> VerificationResult:
-    """**G5 — Location consistency** (Län / Kommun) within each crash."""
-    counts = df_personer.groupby(COL_CRASH_ID).size()
-    multi = counts[counts > 1].index
-    df_multi = df_personer[df_personer[COL_CRASH_ID].isin(multi)]
-
-    lan_nuniq = df_multi.groupby(COL_CRASH_ID)[COL_COUNTY].nunique()
-    kom_nuniq = df_multi.groupby(COL_CRASH_ID)[COL_MUNICIPALITY].nunique()
+    """**G5 — Location consistency** (Län / Kommun) within each crash.
 
-    lan_bad = set(lan_nuniq[lan_nuniq > 1].index)
-    kom_bad = set(kom_nuniq[kom_nuniq > 1].index)
-    all_bad = lan_bad | kom_bad
-
-    rows = []
-    for cid in sorted(all_bad):
-        crash = df_multi[df_multi[COL_CRASH_ID] == cid]
-        reasons = []
-        details_parts = []
-        if cid in lan_bad:
-            reasons.append("Län mismatch")
-            vals = crash[COL_COUNTY].dropna().unique()
-            details_parts.append(f"Län: {', '.join(str(v) for v in vals)}")
-        if cid in kom_bad:
-            reasons.append("Kommun mismatch")
-            vals = crash[COL_MUNICIPALITY].dropna().unique()
-            details_parts.append(f"Kommun: {', '.join(str(v) for v in vals)}")
-        rows.append({
-            "Olycksnummer": cid,
-            "Reason": ", ".join(reasons),
-            "Details": "; ".join(details_parts),
+    *crash_summary* may pass in a precomputed :func:`_crash_level_summary`
+    covering the Län and Kommun columns.
+    """
+    if crash_summary is None:
+        crash_summary = _crash_level_summary(df_personer, _CRASH_SUMMARY_COLS["G5"])
+
+    lan_bad = (crash_summary[COL_COUNTY] > 1).to_numpy()
+    kom_bad = (crash_summary[COL_MUNICIPALITY] > 1).to_numpy()
+    any_bad = lan_bad | kom_bad
+    bad_ids = crash_summary.index[any_bad]
+    lan_bad, kom_bad = lan_bad[any_bad], kom_bad[any_bad]
+
+    n = len(bad_ids)
+    details = None
+    if n:
+        # Distinct values of each location column per flagged crash, in order
+        # of first appearance, from one pass over the flagged rows
+        flagged = df_personer.loc[
+            df_personer[COL_CRASH_ID].isin(bad_ids),
+            [COL_CRASH_ID, COL_COUNTY, COL_MUNICIPALITY],
+        ]
+
+        def _listed(col: str) -> np.ndarray:
+            values = flagged[[COL_CRASH_ID, col]].dropna(subset=[col]).drop_duplicates()
+            joined = values[col].map(str).groupby(values[COL_CRASH_ID]).agg(", ".join)
+            return joined.reindex(bad_ids, fill_value="").to_numpy(dtype=object)
+
+        lan_part = "Län: " + _listed(COL_COUNTY)
+        kom_part = "Kommun: " + _listed(COL_MUNICIPALITY)
+        both = lan_bad & kom_bad
+        reasons = np.where(
+            both,
+            "Län mismatch, Kommun mismatch",
+            np.where(lan_bad, "Län mismatch", "Kommun mismatch"),
+        )
+        details_text = np.where(
+            both, lan_part + "; " + kom_part, np.where(lan_bad, lan_part, kom_part)
+        )
+        details = pd.DataFrame({
+            "Olycksnummer": bad_ids.tolist(),
+            "Reason": reasons.tolist(),
+            "Details": details_text.tolist(),
         })
 
-    details = pd.DataFrame(rows) if rows else None
-    n = len(rows)
-
     return VerificationResult(
         check_id="G5",
         check_name="Location consistency (Län / Kommun)",
@@ -483,44 +639,96 @@ def check_g6_duplicate_persons(
             issue_count=0,
         )
 
-    df_dup = df_personer.copy()
-    for col in dup_cols:
-        df_dup[col] = df_dup[col].fillna("").astype(str)
+    return _g6_result(_g6_candidates(df_personer))
 
-    # Exclude unknowns
-    df_dup = df_dup[
-        (df_dup[COL_AGE] != "")
-        & (df_dup[COL_GENDER] != "")
-        & (df_dup[COL_GENDER].str.lower() != GENDER_UNKNOWN.lower())
-    ]
 
+def _g6_candidates(df_personer: pd.DataFrame) -> pd.DataFrame:
+    """Rows of one block of Personer that take part in G6 duplicate grouping.
+
+    Only the grouping columns and the crash ID are kept, so the candidates
+    of consecutive blocks can be concatenated cheaply.
+    """
+    dup_cols = DUPLICATE_DETECTION_COLS
+
+    # Exclude unknowns before anything else is copied or cast
+    age = df_personer[COL_AGE].fillna("").astype(str)
+    gender = df_personer[COL_GENDER].fillna("").astype(str)
+    keep = (
+        (age != "")
+        & (gender != "")
+        & (gender.str.lower() != GENDER_UNKNOWN.lower())
+    ).to_numpy()
+
+    df_dup = df_personer.loc[keep, [COL_CRASH_ID, *dup_cols]]
+    text = {
+        col: df_dup[col].fillna("").astype(str)
+        for col in dup_cols
+        if col not in (COL_AGE, COL_GENDER)
+    }
+    return df_dup.assign(**{COL_AGE: age[keep], COL_GENDER: gender[keep]}, **text)
+
+
+def _g6_result(df_dup: pd.DataFrame) -> VerificationResult:
+    """Group G6 candidate rows and build the G6 result."""
+    if len(df_dup) < 2:
+        # Nothing to group: a duplicate needs at least two persons
+        return _g6_summary(None)
+
+    dup_cols = DUPLICATE_DETECTION_COLS
     grouped = df_dup.groupby(dup_cols)
+    group_ids = grouped.ngroup().to_numpy(dtype=np.int64)
 
-    rows = []
-    for name, group in grouped:
-        unique_crashes = group[COL_CRASH_ID].unique()
-        if len(unique_crashes) > 1:
-            info = dict(zip(dup_cols, name))
-            rows.append({
-                "Olycksnummer": ", ".join(str(c) for c in sorted(unique_crashes)),
-                "Num_crashes": len(unique_crashes),
-                "Num_entries": len(group),
-                "Age": info.get(COL_AGE, ""),
-                "Gender": info.get(COL_GENDER, ""),
-                "Date": f"{info.get(COL_YEAR, '')}-{info.get(COL_MONTH, '')}-{info.get(COL_DAY, '')}",
-                "Time": info.get(COL_TIME, ""),
-                "County": info.get(COL_COUNTY, ""),
-                "Municipality": info.get(COL_MUNICIPALITY, ""),
-                "Street": info.get(COL_STREET, ""),
-                "Road_user_type": info.get(COL_CATEGORY_MAIN, ""),
-            })
-
-    # Sort by number of crashes descending
-    rows.sort(key=lambda x: x["Num_crashes"], reverse=True)
+    # Encode every (group, crash) pair as one int64 and deduplicate the
+    # pairs by hashing; crash codes follow the sorted crash IDs
+    crash_codes, crash_values = pd.factorize(
+        df_dup[COL_CRASH_ID], sort=True, use_na_sentinel=False
+    )
+    n_values = max(len(crash_values), 1)
+    pairs = pd.unique(group_ids * n_values + crash_codes)
+    num_crashes = np.bincount(pairs // n_values, minlength=grouped.ngroups)
+    flagged = num_crashes > 1
+    if not flagged.any():
+        return _g6_summary(None)
+
+    # Only the pairs of flagged groups are sorted (by group, then crash ID)
+    pairs = np.sort(pairs[flagged[pairs // n_values]])
+    pair_groups = pairs // n_values
+
+    # Sort by number of crashes descending (stable, so ties keep key order)
+    order = np.argsort(-num_crashes[flagged], kind="stable")
+    sizes = grouped.size()
+    keys = sizes.index[flagged][order]
+
+    # Comma-joined crash IDs of each flagged group
+    crash_lists = (
+        pd.Series(crash_values.take(pairs % n_values)).map(str)
+        .groupby(pair_groups).agg(", ".join)
+    )
+    flagged_ids = np.flatnonzero(flagged)[order]
+
+    info = keys.to_frame(index=False)
+    details = pd.DataFrame({
+        "Olycksnummer": crash_lists.loc[flagged_ids].tolist(),
+        "Num_crashes": num_crashes[flagged][order],
+        "Num_entries": sizes.to_numpy()[flagged_ids],
+        "Age": info[COL_AGE].tolist(),
+        "Gender": info[COL_GENDER].tolist(),
+        "Date": (
+            info[COL_YEAR] + "-" + info[COL_MONTH] + "-" + info[COL_DAY]
+        ).tolist(),
+        "Time": info[COL_TIME].tolist(),
+        "County": info[COL_COUNTY].tolist(),
+        "Municipality": info[COL_MUNICIPALITY].tolist(),
+        "Street": info[COL_STREET].tolist(),
+        "Road_user_type": info[COL_CATEGORY_MAIN].tolist(),
+    })
+
+    return _g6_summary(details)
 
-    details = pd.DataFrame(rows) if rows else None
-    n = len(rows)
 
+def _g6_summary(details: pd.DataFrame | None) -> VerificationResult:
+    """Wrap the G6 duplicate groups (or ``None``) in a result."""
+    n = 0 if details is None else len(details)
     return VerificationResult(
         check_id="G6",
         check_name="Duplicate person detection (all road-user types)",
@@ -557,21 +765,22 @@ def check_c1_g1_single_cyclist(
         df_olyckor[COL_CRASH_TYPE] == G1_CRASH_TYPE, COL_CRASH_ID
     ].unique()
     g1_persons = df_personer[df_personer[COL_CRASH_ID].isin(g1_ids)]
-    person_counts = g1_persons.groupby(COL_CRASH_ID).size()
+
+    # Passengers are counted via the keyword in either role column
+    is_pax = (
+        g1_persons[COL_ROLE_P].fillna("").str.lower().str.contains("passagerare")
+        | g1_persons[COL_ROLE_S].fillna("").str.lower().str.contains("passagerare")
+    )
+    counts = is_pax.groupby(g1_persons[COL_CRASH_ID]).agg(["size", "sum"])
+    person_counts = counts["size"]
 
     rows = []
 
     # Multi-person G1 crashes
-    multi_ids = person_counts[person_counts > 1].index
-    for cid in multi_ids:
-        grp = g1_persons[g1_persons[COL_CRASH_ID] == cid]
-        n_persons = len(grp)
-        # Count passengers
-        p_roles = grp[COL_ROLE_P].fillna("").str.lower()
-        s_roles = grp[COL_ROLE_S].fillna("").str.lower()
-        n_passengers = int(
-            (p_roles.str.contains("passagerare") | s_roles.str.contains("passagerare")).sum()
-        )
+    multi = counts[person_counts > 1]
+    for cid, n_persons, n_passengers in zip(
+        multi.index.tolist(), multi["size"].tolist(), multi["sum"].tolist(),
+    ):
         if n_passengers > 0:
             reason = f"Multiple entries ({n_persons} persons, {n_passengers} passengers)"
         else:
@@ -582,10 +791,12 @@ def check_c1_g1_single_cyclist(
     single_ids = person_counts[person_counts == 1].index
     single = g1_persons[g1_persons[COL_CRASH_ID].isin(single_ids)]
     not_cykel = single[single[COL_CATEGORY_MAIN] != CYKEL_CATEGORY]
-    for _, r in not_cykel.iterrows():
+    for cid, category in zip(
+        not_cykel[COL_CRASH_ID].tolist(), not_cykel[COL_CATEGORY_MAIN].tolist(),
+    ):
         rows.append({
-            "Olycksnummer": r[COL_CRASH_ID],
-            "Reason": f"Single entry but not Cykel (is: {r[COL_CATEGORY_MAIN]})",
+            "Olycksnummer": cid,
+            "Reason": f"Single entry but not Cykel (is: {category})",
         })
 
     details = pd.DataFrame(rows) if rows else None
@@ -608,15 +819,18 @@ def check_c1_g1_single_cyclist(
 def check_c2_cykel_presence(
     df_olyckor: pd.DataFrame | None,
     df_personer: pd.DataFrame,
+    *,
+    crash_summary: pd.DataFrame | None = None,
 ) -> VerificationResult:
     """**C2 — Cykel presence** in every crash.
 
     Verifies that each ``Olycksnummer`` has at least one person with
-    ``Huvudgrupp == 'Cykel'``.
+    ``Huvudgrupp == 'Cykel'``.  *crash_summary* may pass in a precomputed
+    :func:`_crash_level_summary` with ``has_cykel``.
     """
-    has_cykel = df_personer.groupby(COL_CRASH_ID)[COL_CATEGORY_MAIN].apply(
-        lambda g: (g == CYKEL_CATEGORY).any()
-    )
+    if crash_summary is None:
+        crash_summary = _crash_level_summary(df_personer, cykel=True)
+    has_cykel = crash_summary["has_cykel"]
     missing_ids = has_cykel[~has_cykel].index
 
     rows = []
@@ -655,7 +869,10 @@ def check_c3_cykel_passengers_only(
     (``Passagerare bak``, ``Passagerare fram``, etc.) and none is a
     driver / cyclist.
     """
-    cykel = df_personer[df_personer[COL_CATEGORY_MAIN] == CYKEL_CATEGORY].copy()
+    cykel = df_personer.loc[
+        df_personer[COL_CATEGORY_MAIN] == CYKEL_CATEGORY,
+        [COL_CRASH_ID, COL_ROLE_P, COL_ROLE_S],
+    ]
 
     if len(cykel) == 0:
         return VerificationResult(
@@ -666,12 +883,12 @@ def check_c3_cykel_passengers_only(
             issue_count=0,
         )
 
-    cykel["_is_pax"] = False
-    for role in PASSENGER_ROLES:
-        cykel["_is_pax"] |= cykel[COL_ROLE_P].fillna("").str.contains(role, na=False)
-        cykel["_is_pax"] |= cykel[COL_ROLE_S].fillna("").str.contains(role, na=False)
+    is_pax = (
+        cykel[COL_ROLE_P].fillna("").str.contains(_PASSENGER_PATTERN, na=False)
+        | cykel[COL_ROLE_S].fillna("").str.contains(_PASSENGER_PATTERN, na=False)
+    )
 
-    agg = cykel.groupby(COL_CRASH_ID)["_is_pax"].agg(["all", "sum", "count"])
+    agg = is_pax.groupby(cykel[COL_CRASH_ID]).agg(["all", "sum", "count"])
     agg.columns = ["all_pax", "n_pax", "n_cykel"]
     only_pax = agg[agg["all_pax"]]
 
@@ -702,7 +919,7 @@ def check_c3_cykel_passengers_only(
 # ╚═══════════════════════════════════════════════════════════════════════════╝
 
 # Registry of checks
-GENERIC_CHECKS = [
+GENERIC_CHECKS: list[CheckFunc] = [
     check_g1_id_consistency,
     check_g2_crash_type,
     check_g3_road_user_category,
@@ -711,22 +928,62 @@ GENERIC_CHECKS = [
     check_g6_duplicate_persons,
 ]
 
-CYCLING_CHECKS = [
+CYCLING_CHECKS: list[CheckFunc] = [
     check_c1_g1_single_cyclist,
     check_c2_cykel_presence,
     check_c3_cykel_passengers_only,
 ]
 
 
+def _check_id(func: CheckFunc) -> str:
+    """The ``check_id`` a check returns, from its name (``check_g1_…`` → ``"G1"``)."""
+    return func.__name__.split("_")[1].upper()
+
+
+# The same checks keyed by check ID, for running them one at a time
+CHECK_REGISTRY: dict[str, CheckFunc] = {
+    _check_id(func): func for func in GENERIC_CHECKS + CYCLING_CHECKS
+}
+
+
+def select_checks(
+    *,
+    include_cycling: bool = False,
+    checks: list[str] | None = None,
+) -> list[str]:
+    """Return the IDs of the checks :func:`run_checks` would run, in order.
+
+    Parameters
+    ----------
+    include_cycling : bool
+        If ``True``, cycling-specific checks (C1–C3) are included.
+    checks : list[str], optional
+        Keep only these check IDs.  If ``None``, keep all applicable.
+
+    Returns
+    -------
+    list[str]
+    """
+    ids = [_check_id(func) for func in GENERIC_CHECKS]
+    if include_cycling:
+        ids.extend(_check_id(func) for func in CYCLING_CHECKS)
+    if checks is not None:
+        ids = [check_id for check_id in ids if check_id in checks]
+    return ids
+
+
 def run_checks(
     df_olyckor: pd.DataFrame,
     df_personer: pd.DataFrame,
     *,
     include_cycling: bool = False,
     checks: list[str] | None = None,
+    parallel: bool = False,
 ) -> list[VerificationResult]:
     """Run selected verification checks and return results.
 
+    Only the selected checks are executed; the others are skipped entirely.
+
     Parameters
     ----------
     df_olyckor : pd.DataFrame
@@ -736,21 +993,184 @@ def run_checks(
     checks : list[str], optional
         Run only checks whose ``check_id`` appears in this list
         (e.g. ``["G1", "G4", "C2"]``).  If ``None``, run all applicable.
+    parallel : bool
+        If ``True``, run the checks in worker processes on multi-core
+        machines (see :func:`_run_in_processes`).  Worth it for large
+        tables; on platforms that spawn rather than fork, the calling
+        script needs an ``if __name__ == "__main__":`` guard.
 
     Returns
     -------
     list[VerificationResult]
     """
-    all_funcs = list(GENERIC_CHECKS)
-    if include_cycling:
-        all_funcs.extend(CYCLING_CHECKS)
+    ids = select_checks(include_cycling=include_cycling, checks=checks)
+    if parallel:
+        results = _run_in_processes(ids, df_olyckor, df_personer)
+    else:
+        results = _run_on_full_table(ids, df_olyckor, df_personer)
+    return [results[check_id] for check_id in ids]
+
+
+def _run_on_full_table(
+    ids: list[str],
+    df_olyckor: pd.DataFrame,
+    df_personer: pd.DataFrame,
+) -> dict[str, VerificationResult]:
+    """Run the checks *ids* on the full tables, keyed by check ID.
+
+    When more than one of G4, G5 and C2 is selected, their per-crash
+    aggregates come from one shared :func:`_crash_level_summary` rather
+    than a groupby each.
+    """
+    sharing = [check_id for check_id in ids if check_id in _CRASH_SUMMARY_COLS]
+    crash_summary = None
+    if len(sharing) > 1:
+        crash_summary = _crash_level_summary(
+            df_personer,
+            [col for check_id in sharing for col in _CRASH_SUMMARY_COLS[check_id]],
+            cykel="C2" in sharing,
+        )
+
+    results = {}
+    for check_id in ids:
+        if crash_summary is not None and check_id in sharing:
+            results[check_id] = CHECK_REGISTRY[check_id](
+                df_olyckor, df_personer, crash_summary=crash_summary
+            )
+        else:
+            results[check_id] = CHECK_REGISTRY[check_id](df_olyckor, df_personer)
+    return results
 
-    results = []
-    for func in all_funcs:
-        # Determine check_id from the function (convention: last part of name)
-        # We'll just run it and check the result's id
-        result = func(df_olyckor, df_personer)
-        if checks is None or result.check_id in checks:
-            results.append(result)
 
+# Tables of the current worker process, set once by _init_worker
+_WORKER_TABLES: tuple[pd.DataFrame, pd.DataFrame] | None = None
+
+
+def _init_worker(df_olyckor: pd.DataFrame, df_personer: pd.DataFrame) -> None:
+    global _WORKER_TABLES
+    _WORKER_TABLES = (df_olyckor, df_personer)
+
+
+def _run_in_worker(ids: list[str]) -> dict[str, VerificationResult]:
+    return _run_on_full_table(ids, *_WORKER_TABLES)
+
+
+def _run_in_processes(
+    ids: list[str],
+    df_olyckor: pd.DataFrame,
+    df_personer: pd.DataFrame,
+) -> dict[str, VerificationResult]:
+    """Parallel :func:`_run_on_full_table` over a process pool.
+
+    The checks are independent, so each runs as its own task; G4, G5 and C2
+    stay in one task to keep sharing their per-crash summary.  The tables
+    reach each worker once, through the pool initializer (inherited without
+    pickling where processes are forked), and only the results travel back.
+    Runs in-process on a single core or when there is only one task.
+    """
+    sharing = [check_id for check_id in ids if check_id in _CRASH_SUMMARY_COLS]
+    tasks = [[check_id] for check_id in ids if check_id not in sharing]
+    if sharing:
+        tasks.append(sharing)
+
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return _run_on_full_table(ids, df_olyckor, df_personer)
+
+    results: dict[str, VerificationResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(df_olyckor, df_personer),
+    ) as ex:
+        for partial in ex.map(_run_in_worker, tasks):
+            results.update(partial)
     return results
+
+
+#: Checks that :func:`run_checks_chunked` evaluates block by block
+STREAMABLE_CHECKS = ("G1", "G3", "G6")
+
+
+def run_checks_chunked(
+    df_olyckor: pd.DataFrame,
+    personer_chunks: Iterable[pd.DataFrame],
+    load_personer: Callable[[], pd.DataFrame],
+    *,
+    include_cycling: bool = False,
+    checks: list[str] | None = None,
+    parallel: bool = False,
+) -> list[VerificationResult]:
+    """Run selected checks while streaming Personer in chunks.
+
+    Checks in :data:`STREAMABLE_CHECKS` only need per-row or per-ID state,
+    so they are accumulated over *personer_chunks* without holding the full
+    table.  Any other selected check needs the whole table; for those
+    *load_personer* is called once after streaming and the check is run as
+    in :func:`run_checks`.
+
+    Parameters
+    ----------
+    df_olyckor : pd.DataFrame
+    personer_chunks : iterable of pd.DataFrame
+        Consecutive blocks of the Personer table (e.g. from
+        :func:`strada.io.readers.iter_csv`).
+    load_personer : callable
+        Returns the full Personer table; only called if needed.
+    include_cycling, checks, parallel
+        As in :func:`run_checks`; *parallel* applies to the checks run on
+        the full table.
+
+    Returns
+    -------
+    list[VerificationResult] — in the same order as :func:`run_checks`.
+    """
+    ids = select_checks(include_cycling=include_cycling, checks=checks)
+    streamed = [check_id for check_id in ids if check_id in STREAMABLE_CHECKS]
+
+    personer_ids: list[np.ndarray] = []
+    g3_partials: list[dict] = []
+    g6_parts: list[pd.DataFrame] = []
+    columns = None
+
+    results: dict[str, VerificationResult] = {}
+    if streamed:
+        offset = 0
+        for chunk in personer_chunks:
+            # Row labels continue across chunks, as in a full load
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            columns = chunk.columns
+            g6_streamable = all(c in columns for c in DUPLICATE_DETECTION_COLS)
+
+            if "G1" in streamed:
+                personer_ids.append(chunk[COL_CRASH_ID].unique())
+            if "G3" in streamed:
+                g3_partials.append(_g3_partial(chunk))
+            if "G6" in streamed and g6_streamable:
+                g6_parts.append(_g6_candidates(chunk))
+
+    # An empty file yields no chunks; those checks fall back to a full load
+    if columns is not None:
+        if "G1" in streamed:
+            results["G1"] = _g1_result(
+                df_olyckor[COL_CRASH_ID].unique(), np.concatenate(personer_ids)
+            )
+        if "G3" in streamed:
+            results["G3"] = _g3_result(g3_partials)
+        if "G6" in streamed:
+            if g6_streamable:
+                results["G6"] = _g6_result(_concat_parts(g6_parts))
+            else:
+                # Reports the missing columns
+                results["G6"] = check_g6_duplicate_persons(
+                    df_olyckor, pd.DataFrame(columns=columns)
+                )
+
+    remaining = [check_id for check_id in ids if check_id not in results]
+    if remaining:
+        df_personer = load_personer()
+        run = _run_in_processes if parallel else _run_on_full_table
+        results.update(run(remaining, df_olyckor, df_personer))
+
+    return [results[check_id] for check_id in ids]
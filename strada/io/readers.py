@@ -6,43 +6,492 @@ All encoding and dtype handling is centralised here.
 
 from __future__ import annotations
 
+import codecs
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 
 from strada.config.constants import CSV_ENCODING, COL_CRASH_ID
 
+_DTYPE_BACKENDS = ("numpy", "pyarrow")
+
 
 def load_csv(
-    path: str | Path,
+    path: str | Path | IO[bytes],
     *,
     encoding: str = CSV_ENCODING,
+    categorical_cols: Iterable[str] | None = None,
+    dtype_backend: str = "numpy",
+    columns: Iterable[str] | None = None,
 ) -> pd.DataFrame:
     """Read a STRADA CSV file with the correct encoding.
 
+    Parsing is done by PyArrow's multithreaded CSV reader; the result is
+    converted to a regular NumPy-backed DataFrame so that column dtypes match
+    what ``pandas.read_csv`` would have produced.
+
     Parameters
     ----------
-    path : str or Path
-        Absolute or relative path to the CSV file.
+    path : str, Path or binary file-like
+        Path to the CSV file, or an open binary buffer (e.g. a Streamlit
+        upload).
     encoding : str, optional
         Character encoding.  Defaults to ``utf-8-sig`` (the encoding used
         by STRADA exports on Windows).
+    categorical_cols : iterable of str, optional
+        Text columns to return as ``category`` dtype (e.g.
+        ``CATEGORICAL_COLS``); absent columns are ignored.  The
+        values are dictionary-encoded by Arrow before conversion.  Note that
+        categoricals only compare with categoricals of the same categories,
+        so the verification checks expect plain columns.
+    dtype_backend : {"numpy", "pyarrow"}, optional
+        ``"numpy"`` (default) gives the ``pandas.read_csv`` dtypes.
+        ``"pyarrow"`` keeps the parsed Arrow buffers as ``pd.ArrowDtype``
+        columns without a conversion copy, so ``isna``/``.str`` operations
+        run on Arrow kernels; intended for ad-hoc analysis, as the
+        verification checks and the classifier expect the default dtypes.
+    columns : iterable of str, optional
+        Only parse these columns (e.g. ``PERSONER_COLUMNS`` from
+        :mod:`strada.core.verify`); the others are skipped by the reader
+        and never converted.  Absent columns are ignored and the file's
+        column order is kept, but at least one must be present.  By
+        default every column is read.
 
     Returns
     -------
     pd.DataFrame
+
+    Raises
+    ------
+    ValueError
+        If *columns* is given and none of them is in the file.
+    """
+    if dtype_backend not in _DTYPE_BACKENDS:
+        raise ValueError(
+            f"Unknown dtype backend {dtype_backend!r}; expected one of "
+            f"{', '.join(_DTYPE_BACKENDS)}"
+        )
+
+    if isinstance(path, (str, Path)):
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+        source = str(path)
+    else:
+        source = path
+
+    # Arrow decodes UTF-8 natively (including a leading BOM)
+    if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+        encoding = "utf8"
+
+    include_columns = None
+    if columns is not None:
+        include_columns = _present_columns(source, encoding, columns)
+        if not isinstance(source, str):
+            source.seek(0)
+
+    table = _read_csv_table(source, encoding, include_columns=include_columns)
+
+    # Arrow infers dates/timestamps, pandas does not — keep them as text.
+    # Integers beyond int64 were parsed as doubles; re-read them as text so
+    # no digits are lost and convert them as pandas does
+    temporal = [f.name for f in table.schema if pa.types.is_temporal(f.type)]
+    overflowed = _overflowed_integers(table)
+    if temporal or overflowed:
+        if not isinstance(source, str):
+            source.seek(0)
+        table = _read_csv_table(
+            source,
+            encoding,
+            column_types={name: pa.string() for name in temporal + overflowed},
+            include_columns=include_columns,
+        )
+        for i, name in enumerate(table.schema.names):
+            if name in overflowed:
+                table = table.set_column(i, name, _parse_wide_integers(table.column(i)))
+
+    if categorical_cols is not None:
+        table = _dictionary_encode(table, categorical_cols)
+
+    if dtype_backend == "pyarrow":
+        # Dictionary-encoded columns still become pandas categoricals
+        return _mangle_duplicate_names(table).to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t),
+            split_blocks=True,
+            self_destruct=True,
+        )
+    return _table_to_frame(table)
+
+
+def _dictionary_encode(table: pa.Table, columns: Iterable[str]) -> pa.Table:
+    """Dictionary-encode the text *columns* of *table* (→ pandas categoricals)."""
+    for name in columns:
+        i = table.schema.get_field_index(name)
+        if i >= 0 and pa.types.is_string(table.schema.field(i).type):
+            table = table.set_column(i, name, pc.dictionary_encode(table.column(i)))
+    return table
+
+
+def _present_columns(
+    source: str | IO[bytes],
+    encoding: str,
+    columns: Iterable[str],
+) -> list[str]:
+    """The names in *columns* that the CSV header has, in file order.
+
+    Raises
+    ------
+    ValueError
+        If the header has none of them (Arrow would read every column
+        for an empty ``include_columns``).
+    """
+    # Open the file ourselves so the handle is closed with the probe
+    stream = pa.OSFile(source) if isinstance(source, str) else nullcontext(source)
+    with stream as f, pacsv.open_csv(
+        f, read_options=pacsv.ReadOptions(encoding=encoding),
+    ) as reader:
+        names = reader.schema.names
+    wanted = set(columns)
+    present = [name for name in names if name in wanted]
+    if not present:
+        raise ValueError(
+            f"None of the requested columns ({', '.join(sorted(wanted))}) "
+            f"is in the CSV header"
+        )
+    return present
+
+
+def iter_csv(
+    path: str | Path,
+    chunk_size: int,
+    *,
+    encoding: str = CSV_ENCODING,
+    columns: Iterable[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream a STRADA CSV file as a sequence of DataFrames.
+
+    Uses PyArrow's streaming CSV reader, so only one block of roughly
+    *chunk_size* MB is held in memory at a time.  Column types are settled
+    over the whole file first, by a streaming pass over the columns that
+    are not text in the first block, so a column that turns to text (or
+    gains missing values) late in the file is read as a full
+    :func:`load_csv` would read it.  Each chunk is then converted like
+    :func:`load_csv`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the CSV file.
+    chunk_size : int
+        Approximate size of each chunk, in megabytes.
+    encoding : str, optional
+        Character encoding.  Defaults to ``utf-8-sig``.
+    columns : iterable of str, optional
+        Only parse these columns, as in :func:`load_csv`.
+
+    Yields
+    ------
+    pd.DataFrame
     """
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
+    if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+        encoding = "utf8"
+
+    block_size = max(int(chunk_size), 1) << 20
+
+    include_columns = None
+    if columns is not None:
+        include_columns = _present_columns(str(path), encoding, columns)
+    column_types = _stream_column_types(path, encoding, block_size, include_columns)
+
+    with _open_csv_stream(
+        path, encoding, block_size, column_types, include_columns,
+    ) as reader:
+        for batch in reader:
+            yield _table_to_frame(pa.Table.from_batches([batch]))
+
+
+# Types pandas.read_csv gives a column, by what its values parse as.  A
+# column takes the widest kind over all of its values (see _join_kinds);
+# "uint" holds non-negative int64 values, "wide" integers beyond int64
+_KIND_TYPES = {
+    "null": pa.null(),
+    "uint": pa.int64(),
+    "int": pa.int64(),
+    "wide": pa.uint64(),
+    "bool": pa.bool_(),
+    "float": pa.float64(),
+    "text": pa.string(),
+}
+
+_INTEGER_KINDS = ("uint", "int", "wide")
+
+# The values Arrow's CSV reader parses as booleans
+_BOOL_STRINGS = pa.array(["1", "True", "TRUE", "true", "0", "False", "FALSE", "false"])
+
+
+def _stream_column_types(
+    path: Path,
+    encoding: str,
+    block_size: int,
+    include_columns: list[str] | None,
+) -> dict[str, pa.DataType]:
+    """Column types for streaming *path* so every block converts alike.
+
+    The streaming reader fixes each column's type from the first block and
+    fails on a later value that does not fit.  Text columns take any value
+    and dates are kept as text anyway; the remaining columns are streamed
+    once as text and given the widest type their values need across the
+    whole file, as a full read would.
+    """
+    with _open_csv_stream(
+        path, encoding, block_size, include_columns=include_columns,
+    ) as reader:
+        schema = reader.schema
+
+    column_types = {f.name: pa.string() for f in schema if pa.types.is_temporal(f.type)}
+    kinds = {
+        f.name: "null"
+        for f in schema
+        if pa.types.is_null(f.type)
+        or pa.types.is_integer(f.type)
+        or pa.types.is_floating(f.type)
+        or pa.types.is_boolean(f.type)
+    }
+    if not kinds:
+        return column_types
+
+    has_nulls = dict.fromkeys(kinds, False)
+    with _open_csv_stream(
+        path, encoding, block_size,
+        column_types={name: pa.string() for name in kinds},
+        include_columns=list(kinds),
+    ) as reader:
+        for batch in reader:
+            for name, column in zip(batch.schema.names, batch.columns):
+                if kinds[name] != "text":
+                    kinds[name] = _join_kinds(kinds[name], _value_kind(column))
+                    has_nulls[name] |= column.null_count > 0
+            if all(kind == "text" for kind in kinds.values()):
+                break
+
+    for name, kind in kinds.items():
+        if has_nulls[name] and kind in _INTEGER_KINDS:
+            # pandas holds missing values in float columns; integers beyond
+            # int64 with gaps stay text (see _parse_wide_integers)
+            kind = "float" if kind != "wide" else "text"
+        column_types[name] = _KIND_TYPES[kind]
+    return column_types
+
+
+def _value_kind(column: pa.Array) -> str:
+    """The narrowest kind in ``_KIND_TYPES`` that every value of *column* parses as."""
+    if column.null_count == len(column):
+        return "null"
+    # The CSV converters skip surrounding spaces, the cast kernels do not
+    text = pc.utf8_trim(pc.drop_null(column), " \t")
+    for kind in ("int", "wide"):
+        try:
+            values = pc.cast(text, _KIND_TYPES[kind])
+        except pa.ArrowInvalid:
+            continue
+        if kind == "int" and pc.min(values).as_py() >= 0:
+            return "uint"
+        return kind
+    if pc.all(pc.match_substring_regex(text, r"^[+-]?\d+$")).as_py():
+        # Whole numbers beyond both int64 and uint64 stay text
+        return "text"
+    if pc.all(pc.is_in(text, value_set=_BOOL_STRINGS)).as_py():
+        return "bool"
+    try:
+        pc.cast(text, pa.float64())
+    except pa.ArrowInvalid:
+        return "text"
+    return "float"
+
+
+def _join_kinds(a: str, b: str) -> str:
+    """The kind a column with values of kinds *a* and *b* takes."""
+    if a == b or b == "null":
+        return a
+    if a == "null":
+        return b
+    pair = {a, b}
+    if pair <= set(_INTEGER_KINDS):
+        # Negative values rule out uint64, and wide values rule out int64
+        return "int" if "wide" not in pair else ("wide" if "int" not in pair else "text")
+    if pair <= {*_INTEGER_KINDS, "float"}:
+        return "float"
+    return "text"
+
+
+# The strings pandas.read_csv reads as missing by default; Arrow's defaults
+# lack "None" and "<NA>"
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def _read_csv_table(
+    source: str | IO[bytes],
+    encoding: str,
+    column_types: dict[str, pa.DataType] | None = None,
+    include_columns: list[str] | None = None,
+) -> pa.Table:
+    """Parse a CSV into an Arrow table with ``pandas.read_csv``-like options."""
+    return pacsv.read_csv(
+        source,
+        read_options=pacsv.ReadOptions(use_threads=True, encoding=encoding),
+        # Free-text narratives may contain quoted line breaks
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            null_values=_NA_VALUES,
+            strings_can_be_null=True,
+            column_types=column_types,
+            include_columns=include_columns,
+        ),
+    )
+
+
+def _open_csv_stream(
+    path: Path,
+    encoding: str,
+    block_size: int,
+    column_types: dict[str, pa.DataType] | None = None,
+    include_columns: list[str] | None = None,
+) -> pacsv.CSVStreamingReader:
+    """Open a streaming CSV reader with the same options as :func:`_read_csv_table`."""
+    return pacsv.open_csv(
+        str(path),
+        read_options=pacsv.ReadOptions(
+            use_threads=True, encoding=encoding, block_size=block_size,
+        ),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            null_values=_NA_VALUES,
+            strings_can_be_null=True,
+            column_types=column_types,
+            include_columns=include_columns,
+        ),
+    )
+
+
+def _overflowed_integers(table: pa.Table) -> list[str]:
+    """The float columns of *table* holding values beyond the int64 range.
+
+    Arrow parses integers too large for int64 as doubles; these columns
+    are re-read as text and handed to :func:`_parse_wide_integers`.
+    """
+    names = []
+    for field, column in zip(table.schema, table.columns):
+        if pa.types.is_floating(field.type):
+            largest = pc.max(pc.abs(column)).as_py()
+            if largest is not None and largest >= 2**63:
+                names.append(field.name)
+    return names
+
+
+def _parse_wide_integers(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Parse a column of integers beyond int64, read as text, like pandas.
+
+    Whole numbers that all fit in uint64 (with none missing) become uint64,
+    other whole numbers stay text (pandas 3 gives Python ints for values
+    beyond uint64, pandas 2 gives text), and anything else (e.g. ``1e19``)
+    is parsed as float.
+    """
+    text = pc.utf8_trim(column, " \t")
+    if not pc.all(pc.match_substring_regex(text, r"^[+-]?\d+$")).as_py():
+        return pc.cast(text, pa.float64())
+    if column.null_count == 0:
+        try:
+            return pc.cast(text, pa.uint64())
+        except pa.ArrowInvalid:
+            pass
+    return column
+
+
+def _mangle_duplicate_names(table: pa.Table) -> pa.Table:
+    """Rename repeated column names ``a, a`` to ``a, a.1`` as pandas does.
+
+    Suffixes that would clash with another header name are skipped, so
+    ``a, a, a.1`` becomes ``a, a.2, a.1`` exactly as in ``pandas.read_csv``.
+    """
+    names = table.schema.names
+    if len(set(names)) == len(names):
+        return table
+    header = set(names)
+    counts: dict[str, int] = {}
+    mangled = []
+    for name in names:
+        count = counts.get(name, 0)
+        if count:
+            base = name
+            while count:
+                counts[base] = count + 1
+                name = f"{base}.{count}"
+                count = count + 1 if name in header else counts.get(name, 0)
+        mangled.append(name)
+        counts[name] = count + 1
+    return table.rename_columns(mangled)
+
+
+def _table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """Convert a parsed CSV table to a DataFrame as ``pandas.read_csv`` would."""
+    # Match pandas.read_csv: all-empty columns are float (object in a file
+    # with no rows), missing text is NaN
+    empty = [i for i, field in enumerate(table.schema) if pa.types.is_null(field.type)]
+    for i in empty:
+        table = table.set_column(i, table.field(i).name, table.column(i).cast(pa.float64()))
+
+    n_rows = table.num_rows
+    df = _mangle_duplicate_names(table).to_pandas(split_blocks=True, self_destruct=True)
+    if not n_rows:
+        for i in empty:
+            df.isetitem(i, df.iloc[:, i].astype(object))
+    for col in df.columns:
+        if df[col].dtype == "object":
+            df[col] = df[col].where(df[col].notna(), np.nan)
+
+    return df
+
+
+def load_parquet(path: str | Path) -> pd.DataFrame:
+    """Read a Parquet file saved from a :func:`load_csv` frame.
+
+    The Arrow table is converted exactly as :func:`load_csv` converts a
+    parsed CSV, so missing text comes back as NaN (``pandas.read_parquet``
+    gives ``None`` on pandas 2) and the frame equals the one that was saved.
+
+    Parameters
+    ----------
+    path : str or Path
 
-    return pd.read_csv(path, encoding=encoding, low_memory=False)
+    Returns
+    -------
+    pd.DataFrame
+    """
+    return _table_to_frame(pq.read_table(path))
 
 
 def load_excel_sheet(
-    path: str | Path,
+    path: str | Path | IO[bytes],
     sheet_name: str,
+    *,
+    categorical_cols: Iterable[str] | None = None,
 ) -> pd.DataFrame:
     """Read a single sheet from a STRADA Excel workbook.
 
@@ -51,32 +500,114 @@ def load_excel_sheet(
 
     Parameters
     ----------
-    path : str or Path
-        Path to the ``.xlsx`` file.
+    path : str, Path or binary file-like
+        Path to the ``.xlsx`` file, or an open binary buffer (e.g. a
+        Streamlit upload).
     sheet_name : str
         Name of the sheet to read (e.g. ``"Olyckor"`` or ``"Personer"``).
+    categorical_cols : iterable of str, optional
+        Columns to convert to ``category`` dtype, as in :func:`load_csv`.
 
     Returns
     -------
     pd.DataFrame
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Excel file not found: {path}")
+    return load_excel_sheets(
+        path, [sheet_name], categorical_cols=categorical_cols,
+    )[sheet_name]
 
-    df = pd.read_excel(path, sheet_name=sheet_name)
 
-    # Replace in-cell line breaks with spaces
-    for col in df.columns:
-        if df[col].dtype == "object":
-            df[col] = (
-                df[col]
-                .astype(str)
-                .str.replace("\n", " ", regex=False)
-                .str.replace("\r", " ", regex=False)
-            )
+def load_excel_sheets(
+    path: str | Path | IO[bytes],
+    sheet_names: list[str],
+    *,
+    categorical_cols: Iterable[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Read several sheets from a STRADA Excel workbook.
 
-    return df
+    Sheets are parsed with the Rust-based ``calamine`` engine.  On multi-core
+    machines each sheet is read concurrently in its own thread (with its own
+    workbook handle); on a single core the workbook is opened once so the
+    ZIP container and shared-strings table are parsed only once.  Line
+    breaks are cleaned up as in :func:`load_excel_sheet`.
+
+    Parameters
+    ----------
+    path : str, Path or binary file-like
+        Path to the ``.xlsx`` file, or an open binary buffer.  Buffers are
+        read in memory; nothing is written to disk.
+    sheet_names : list[str]
+        Names of the sheets to read.
+    categorical_cols : iterable of str, optional
+        Columns to convert to ``category`` dtype (after the line-break
+        cleanup), as in :func:`load_csv`.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame] — one DataFrame per sheet name.
+    """
+    if isinstance(path, (str, Path)):
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Excel file not found: {path}")
+
+    sheet_names = list(sheet_names)
+    max_workers = min(len(sheet_names), os.cpu_count() or 1)
+    if max_workers > 1:
+        if isinstance(path, Path):
+            sources = [path] * len(sheet_names)
+        else:
+            # One independent buffer per thread over the same bytes
+            data = path.read()
+            sources = [io.BytesIO(data) for _ in sheet_names]
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {
+                name: ex.submit(pd.read_excel, source, sheet_name=name, engine="calamine")
+                for name, source in zip(sheet_names, sources)
+            }
+            sheets = {name: fut.result() for name, fut in futures.items()}
+    else:
+        sheets = pd.read_excel(path, sheet_name=sheet_names, engine="calamine")
+
+    for df in sheets.values():
+        # Replace in-cell line breaks with spaces
+        for col in df.columns:
+            if df[col].dtype == "object":
+                df[col] = _replace_line_breaks(df[col].astype(str))
+            elif isinstance(df[col].dtype, pd.StringDtype):
+                # Text columns under pandas 3; missing cells stay missing
+                df[col] = _replace_line_breaks(df[col])
+        if categorical_cols is not None:
+            for col in categorical_cols:
+                if col in df.columns:
+                    df[col] = df[col].astype("category")
+
+    return sheets
+
+
+_LINE_BREAKS = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _replace_line_breaks(text: pd.Series) -> pd.Series:
+    """Replace ``\\n`` and ``\\r`` in a text column with spaces."""
+    if text.dtype == "object":
+        # Python strings: translate only the (few) cells that need it, in
+        # one pass, rather than two full-column ``.str.replace`` passes
+        return pd.Series(
+            [
+                v.translate(_LINE_BREAKS) if "\n" in v or "\r" in v else v
+                for v in text.to_numpy()
+            ],
+            index=text.index,
+            name=text.name,
+            dtype=object,
+        )
+    # Arrow-backed strings: the literal replace kernels are the fastest
+    return (
+        text
+        .str.replace("\n", " ", regex=False)
+        .str.replace("\r", " ", regex=False)
+    )
 
 
 def save_csv(
@@ -103,6 +634,200 @@ def save_csv(
     return path
 
 
+# Rows formatted at a time by write_table_csv
+_CSV_BATCH_ROWS = 65_536
+
+# Fields containing any of these characters are quoted (as by ``csv.writer``)
+_CSV_QUOTE_CHARS = '[,"\r\n]'
+
+# Ticks per second of each Arrow timestamp unit
+_TICKS_PER_SECOND = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def write_table_csv(table: pa.Table, sink: str | Path | IO[bytes]) -> None:
+    """Write an Arrow table as UTF-8 CSV with a BOM (Excel-friendly).
+
+    The bytes written are those of ``DataFrame.to_csv(index=False)`` for the
+    frame the table was built from: fields are quoted only when needed,
+    floats keep their ``.0``, timestamp columns holding only dates are
+    written as ``YYYY-MM-DD`` and missing values are left empty.  Columns are
+    formatted with Arrow compute kernels (numpy for fractional floats) and
+    joined into lines in Arrow, which is several times faster than
+    ``to_csv`` on STRADA-sized sheets.
+    Tables with other column types (e.g. durations or time-zone-aware
+    timestamps) are written through pandas.
+
+    Parameters
+    ----------
+    table : pa.Table
+    sink : str, Path or binary file-like
+        Destination file path or an open binary stream.
+    """
+    if isinstance(sink, (str, Path)):
+        with open(sink, "wb") as f:
+            write_table_csv(table, f)
+        return
+    sink.write(codecs.BOM_UTF8)
+
+    if table.num_columns == 0 or not all(
+        _csv_formattable(t) for t in table.schema.types
+    ):
+        table.to_pandas().to_csv(sink, index=False, encoding="utf-8")
+        return
+
+    # Dates vs. times and the fractional digits are chosen per timestamp
+    # column, over all of its values
+    time_units = [
+        _timestamp_unit(column) if pa.types.is_timestamp(column.type) else None
+        for column in table.columns
+    ]
+
+    # The header is a one-row line of the quoted column names
+    names = _csv_strings(pa.array(table.column_names, pa.string()))
+    _write_csv_lines(sink, [names.slice(i, 1) for i in range(len(names))])
+    for batch in table.to_batches(max_chunksize=_CSV_BATCH_ROWS):
+        if batch.num_rows:
+            _write_csv_lines(sink, [
+                _csv_strings(column, unit)
+                for column, unit in zip(batch.columns, time_units)
+            ])
+
+
+def _csv_formattable(dtype: pa.DataType) -> bool:
+    """Whether :func:`_csv_strings` can format an array of type *dtype*."""
+    if pa.types.is_dictionary(dtype):
+        # Categories of timestamps are written as ``str(Timestamp)``
+        return not pa.types.is_timestamp(dtype.value_type) and _csv_formattable(
+            dtype.value_type
+        )
+    if pa.types.is_timestamp(dtype):
+        return dtype.tz is None
+    return (
+        pa.types.is_string(dtype)
+        or pa.types.is_large_string(dtype)
+        or pa.types.is_boolean(dtype)
+        or pa.types.is_integer(dtype)
+        or pa.types.is_floating(dtype)
+        or pa.types.is_date(dtype)
+        or pa.types.is_null(dtype)
+    )
+
+
+def _csv_strings(array: pa.Array, time_unit: str | None = None) -> pa.Array:
+    """Format *array* as CSV fields, the way ``DataFrame.to_csv`` does.
+
+    Timestamps are written with the precision of *time_unit* (see
+    :func:`_timestamp_unit`), or as dates when it is ``None``.
+    """
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    dtype = array.type
+
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+        text = array.cast(pa.string())
+        needs_quotes = pc.match_substring_regex(text, _CSV_QUOTE_CHARS)
+        if pc.any(needs_quotes).as_py():
+            quoted = pc.binary_join_element_wise(
+                '"', pc.replace_substring(text, '"', '""'), '"', "",
+            )
+            text = pc.if_else(needs_quotes, quoted, text)
+    elif pa.types.is_boolean(dtype):
+        text = pc.if_else(array, "True", "False")
+    elif pa.types.is_floating(dtype):
+        text = _csv_floats(array)
+    elif pa.types.is_timestamp(dtype):
+        if time_unit is None:
+            text = array.cast(pa.date32()).cast(pa.string())
+        else:
+            text = array.cast(pa.timestamp(time_unit)).cast(pa.string())
+    elif pa.types.is_null(dtype):
+        text = pa.nulls(len(array), pa.string())
+    else:
+        # Integers and dates
+        text = array.cast(pa.string())
+
+    return pc.fill_null(text, "")
+
+
+def _csv_floats(array: pa.Array) -> pa.Array:
+    """Format floats as ``values.astype(str)`` does (what pandas writes).
+
+    Arrow's own float formatting differs (no ``.0``, other exponent
+    thresholds), so only whole float64 values below 1e16 -- written as the
+    integer plus ``.0`` -- are formatted in Arrow; numpy formats the rest.
+    """
+    values = array.to_numpy(zero_copy_only=False)
+    missing = np.isnan(values)
+    if not pa.types.is_float64(array.type):
+        # Narrower floats switch to exponents much earlier
+        return pa.array(values.astype(str), pa.string(), mask=missing)
+
+    with np.errstate(invalid="ignore"):
+        # -0.0 is written with its sign, so zero takes the numpy route
+        whole = (
+            (np.trunc(values) == values) & (np.abs(values) < 1e16) & (values != 0)
+        )
+    integers = pc.cast(pc.if_else(pa.array(whole), array, 0.0), pa.int64())
+    text = pc.binary_join_element_wise(integers.cast(pa.string()), ".0", "")
+    rest = ~(whole | missing)
+    if rest.any():
+        text = pc.replace_with_mask(
+            text, pa.array(rest), pa.array(values[rest].astype(str), pa.string()),
+        )
+    return pc.if_else(pa.array(missing), pa.scalar(None, pa.string()), text)
+
+
+def _timestamp_unit(column: pa.ChunkedArray) -> str | None:
+    """Precision pandas writes a naive timestamp *column* with.
+
+    ``None`` when every value is a midnight (written as a date); otherwise
+    the coarsest unit (``"s"``, ``"ms"``, ``"us"`` or ``"ns"``) that holds
+    every value exactly.  Missing values are ignored.
+    """
+    per_second = _TICKS_PER_SECOND[column.type.unit]
+    ticks = pc.fill_null(column.cast(pa.int64()), 0).to_numpy()
+    if not (ticks % (86_400 * per_second)).any():
+        return None
+    fraction = ticks % per_second
+    for unit, unit_per_second in _TICKS_PER_SECOND.items():
+        if not (fraction % (per_second // unit_per_second)).any():
+            return unit
+    return column.type.unit
+
+
+def _write_csv_lines(sink: IO[bytes], columns: list[pa.Array]) -> None:
+    """Join formatted *columns* into CSV lines and write them to *sink*."""
+    if len(columns) == 1:
+        # csv.writer quotes the lone field of an otherwise empty line
+        lines = pc.if_else(pc.equal(columns[0], ""), '""', columns[0])
+    else:
+        lines = pc.binary_join_element_wise(*columns, ",")
+    lines = pc.binary_join_element_wise(lines, "", os.linesep)
+    # The string data buffer holds the lines back to back
+    _, offsets, data = lines.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int32)
+    start, end = offsets[lines.offset], offsets[lines.offset + len(lines)]
+    sink.write(memoryview(data)[start:end])
+
+
+def save_table_csv(table: pa.Table, path: str | Path) -> Path:
+    """Arrow counterpart of :func:`save_csv` (always UTF-8 with a BOM).
+
+    Parameters
+    ----------
+    table : pa.Table
+    path : str or Path
+
+    Returns
+    -------
+    Path — the written file path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_table_csv(table, path)
+    return path
+
+
 def load_strada_pair(
     data_dir: str | Path,
     olyckor_name: str = "Olyckor.csv",
@@ -8,11 +8,15 @@ Supports two output formats:
 
 from __future__ import annotations
 
-import csv
+import io
+import os
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Iterator, Optional
 
 import pandas as pd
 
@@ -21,7 +25,14 @@ import pandas as pd
 # Data structure returned by every verification check
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# ``slots=True`` needs Python 3.10+; older interpreters keep a ``__dict__``
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Marks ``VerificationResult.details_table`` as not yet computed
+_UNSET: Any = object()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class VerificationResult:
     """Container for the output of a single verification check.
 
@@ -41,6 +52,9 @@ class VerificationResult:
         Detailed table of flagged records.  Column names are check-specific.
     sub_results : list[VerificationResult]
         Optional nested results for checks with sub-parts (e.g. G3.1–G3.4).
+    has_details : bool
+        ``True`` if ``details`` holds at least one flagged record.  Set on
+        construction.
     """
 
     check_id: str
@@ -50,66 +64,189 @@ class VerificationResult:
     issue_count: int = 0
     details: Optional[pd.DataFrame] = None
     sub_results: list["VerificationResult"] = field(default_factory=list)
+    has_details: bool = field(init=False, repr=False, compare=False)
+    _details_table: Any = field(
+        default=_UNSET, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self.has_details = self.details is not None and len(self.details) > 0
+
+    @property
+    def flat(self) -> tuple["VerificationResult", ...]:
+        """This result followed by its sub-results, in report order."""
+        return (self, *self.sub_results)
+
+    @property
+    def details_table(self) -> Any:
+        """``details`` converted to a ``pyarrow.Table`` for display.
+
+        Computed once per result.  Falls back to the DataFrame itself when a
+        column cannot be represented in Arrow (e.g. mixed-type objects), and
+        is ``None`` when there are no details.
+        """
+        if self._details_table is _UNSET:
+            self._details_table = self._to_table()
+        return self._details_table
+
+    def _to_table(self) -> Any:
+        if self.details is None:
+            return None
+
+        import pyarrow as pa
+
+        try:
+            return pa.Table.from_pandas(self.details, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return self.details
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Output destinations
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Buffer size for report files; large reports are flushed in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Output directories already created (or found) by ``_ensure_dir``
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create *directory* (and parents) unless it was already ensured."""
+    directory = directory.absolute()
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+@contextmanager
+def _open_text(
+    dest: str | Path | IO,
+    encoding: str,
+    newline: str | None = None,
+    sync: bool = False,
+) -> Iterator[IO[str]]:
+    """Yield a text handle for *dest*.
+
+    *dest* may be a file path (opened and created as needed, with a 1 MiB
+    write buffer), an in-memory text stream such as :class:`io.StringIO`
+    (written to directly), or a binary stream such as :class:`io.BytesIO`
+    (encoded with *encoding*).
+    Streams are left open for the caller.  With *sync*, a file is flushed
+    and ``os.fsync``-ed before it is closed.
+    """
+    if isinstance(dest, (str, Path)):
+        path = dest if isinstance(dest, Path) else Path(dest)
+        options = dict(
+            encoding=encoding, newline=newline, buffering=_WRITE_BUFFER_SIZE,
+        )
+        _ensure_dir(path.parent)
+        try:
+            fh = open(path, "w", **options)
+        except FileNotFoundError:
+            # Directory removed since it was ensured: create it again
+            _ENSURED_DIRS.discard(path.parent.absolute())
+            _ensure_dir(path.parent)
+            fh = open(path, "w", **options)
+        with fh:
+            yield fh
+            if sync:
+                fh.flush()
+                os.fsync(fh.fileno())
+    elif isinstance(dest, io.TextIOBase):
+        yield dest
+    else:
+        fh = io.TextIOWrapper(dest, encoding=encoding, newline=newline)
+        try:
+            yield fh
+        finally:
+            fh.flush()
+            fh.detach()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Plain-text report
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Overview-table icon per result status (also used by the web app)
+STATUS_ICONS: dict[str, str] = {"pass": "✓", "warning": "⚠", "fail": "✗"}
+
+# Separator lines
+_HLINE_EQ = "=" * 80 + "\n"
+_HLINE_DASH = "-" * 80 + "\n"
+_COLUMN_RULE = "-" * 60 + "\n"
+
+# Column headings of the overview table
+_OVERVIEW_HEADER = f"{'Check':<8} {'Status':<10} {'Issues':>8}  Description\n"
+
+
 def write_text_report(
     results: list[VerificationResult],
-    path: str | Path,
+    path: str | Path | IO,
     *,
     title: str = "STRADA Data Quality Assessment Report",
     olyckor_count: int | None = None,
     personer_count: int | None = None,
-) -> Path:
+    now: datetime | None = None,
+    sync: bool = False,
+) -> Path | IO:
     """Write a human-readable plain-text report.
 
     Parameters
     ----------
     results : list[VerificationResult]
         Ordered list of verification results to include.
-    path : str or Path
-        Output file path.
+    path : str, Path or file-like
+        Output file path, or an open text / binary stream (e.g.
+        :class:`io.StringIO`) to write the report into.
     title : str
         Report title.
     olyckor_count, personer_count : int, optional
         Dataset sizes to include in the header.
+    now : datetime, optional
+        Timestamp shown as "Generated"; defaults to the current time.  Pass
+        one shared value when writing several reports in a batch so they
+        carry the same (diffable) header.
+    sync : bool
+        Force the written file to disk (``os.fsync``) before returning.
+        Off by default, leaving it to the OS page cache; ignored for
+        streams.
 
     Returns
     -------
-    Path — the written file.
+    Path — the written file (or the stream that was passed in).
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(path, str):
+        path = Path(path)
 
-    with open(path, "w", encoding="utf-8") as fh:
+    with _open_text(path, "utf-8", sync=sync) as fh:
         # Header
-        fh.write("=" * 80 + "\n")
-        fh.write(f"{title}\n")
-        fh.write(f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
-        fh.write("=" * 80 + "\n\n")
+        lines = [
+            _HLINE_EQ,
+            f"{title}\n",
+            f"Generated: {now or datetime.now():%Y-%m-%d %H:%M:%S}\n",
+            _HLINE_EQ + "\n",
+        ]
 
         if olyckor_count is not None or personer_count is not None:
-            fh.write("Dataset summary:\n")
+            lines.append("Dataset summary:\n")
             if olyckor_count is not None:
-                fh.write(f"  Crashes (Olyckor):  {olyckor_count:,}\n")
+                lines.append(f"  Crashes (Olyckor):  {olyckor_count:,}\n")
             if personer_count is not None:
-                fh.write(f"  Persons (Personer): {personer_count:,}\n")
-            fh.write("\n")
+                lines.append(f"  Persons (Personer): {personer_count:,}\n")
+            lines.append("\n")
 
         # Overview table
-        fh.write("-" * 80 + "\n")
-        fh.write(f"{'Check':<8} {'Status':<10} {'Issues':>8}  {'Description'}\n")
-        fh.write("-" * 80 + "\n")
+        lines.append(_HLINE_DASH)
+        lines.append(_OVERVIEW_HEADER)
+        lines.append(_HLINE_DASH)
         for r in results:
-            icon = {"pass": "✓", "warning": "⚠", "fail": "✗"}.get(r.status, "?")
-            fh.write(f"{r.check_id:<8} {icon} {r.status:<8} {r.issue_count:>8}  {r.check_name}\n")
+            lines.append(_overview_line(r, "", 8))
             for sub in r.sub_results:
-                icon_s = {"pass": "✓", "warning": "⚠", "fail": "✗"}.get(sub.status, "?")
-                fh.write(f"  {sub.check_id:<6} {icon_s} {sub.status:<8} {sub.issue_count:>8}  {sub.check_name}\n")
-        fh.write("-" * 80 + "\n\n")
+                lines.append(_overview_line(sub, "  ", 6))
+        lines.append(_HLINE_DASH + "\n")
+        fh.write("".join(lines))
 
         # Detailed sections
         for r in results:
@@ -117,95 +254,205 @@ def write_text_report(
             for sub in r.sub_results:
                 _write_section(fh, sub, indent=2)
 
-        fh.write("=" * 80 + "\n")
-        fh.write("End of Report\n")
-        fh.write("=" * 80 + "\n")
+        fh.write(_HLINE_EQ + "End of Report\n" + _HLINE_EQ)
 
     return path
 
 
+def _overview_line(result: VerificationResult, indent: str, id_width: int) -> str:
+    """One row of the overview table (padded with ``str.ljust``/``rjust``)."""
+    return (
+        indent + result.check_id.ljust(id_width)
+        + " " + STATUS_ICONS.get(result.status, "?")
+        + " " + result.status.ljust(8)
+        + " " + str(result.issue_count).rjust(8)
+        + "  " + result.check_name + "\n"
+    )
+
+
 def _write_section(fh, result: VerificationResult, indent: int = 0) -> None:
-    """Write one check's detailed section to the text report."""
+    """Write one check's detailed section to the text report.
+
+    The lines of the section are collected and written in one call.
+    """
     prefix = " " * indent
-    fh.write(f"\n{'=' * 80}\n")
-    fh.write(f"{prefix}{result.check_id}: {result.check_name}\n")
-    fh.write(f"{'-' * 80}\n")
-    fh.write(f"{prefix}{result.summary}\n")
-
-    if result.details is not None and len(result.details) > 0:
-        fh.write(f"\n{prefix}Flagged records ({len(result.details):,}):\n")
-        # Write column headers
+    lines = [
+        "\n" + _HLINE_EQ,
+        f"{prefix}{result.check_id}: {result.check_name}\n",
+        _HLINE_DASH,
+        f"{prefix}{result.summary}\n",
+    ]
+
+    if result.has_details:
+        lines.append(f"\n{prefix}Flagged records ({len(result.details):,}):\n")
+        # Column headers
         cols = result.details.columns.tolist()
-        fh.write(f"{prefix}  {', '.join(cols)}\n")
-        fh.write(f"{prefix}  {'-' * 60}\n")
-        for _, row in result.details.iterrows():
-            values = [str(row[c]) for c in cols]
-            fh.write(f"{prefix}  {', '.join(values)}\n")
-    fh.write("\n")
+        lines.append(f"{prefix}  {', '.join(cols)}\n")
+        lines.append(f"{prefix}  {_COLUMN_RULE}")
+        line_prefix = prefix + "  "
+        lines.extend(
+            line_prefix + ", ".join(map(str, row)) + "\n"
+            for row in result.details.itertuples(index=False, name=None)
+        )
+    lines.append("\n")
+    fh.write("".join(lines))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CSV report
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Columns of the CSV report
+CSV_REPORT_FIELDS = ("check_id", "check_name", "crash_id", "issue", "details")
+
+# Details rows converted to strings at a time when writing the CSV report
+_CSV_CHUNK_ROWS = 10_000
+
+# Row terminator of the CSV report (as written by ``csv.writer``)
+_CSV_EOL = "\r\n"
+
+
 def write_csv_report(
     results: list[VerificationResult],
-    path: str | Path,
-) -> Path:
+    path: str | Path | IO,
+    *,
+    sync: bool = False,
+) -> Path | IO:
     """Write a CSV report with one row per flagged issue.
 
     The CSV has these columns:
         ``check_id, check_name, crash_id, issue, details``
 
     This file can be opened in Excel for review or further annotation.
+    When every check passes it holds only the header row.  The rows come
+    from :func:`iter_csv_rows` and are written in batches.
 
     Parameters
     ----------
     results : list[VerificationResult]
-    path : str or Path
+    path : str, Path or file-like
+        Output file path, or an open stream.  Binary streams (e.g.
+        :class:`io.BytesIO`) receive the same UTF-8-with-BOM bytes as a file.
+    sync : bool
+        Force the written file to disk (``os.fsync``) before returning;
+        ignored for streams.
 
     Returns
     -------
-    Path — the written file.
+    Path — the written file (or the stream that was passed in).
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(path, str):
+        path = Path(path)
+
+    with _open_text(path, "utf-8-sig", newline="", sync=sync) as fh:
+        fh.write(",".join(CSV_REPORT_FIELDS) + _CSV_EOL)
+
+        # The check_id, check_name and issue fields repeat for every row of
+        # a result, so they are escaped only when they change
+        current = None
+        head = issue_field = ""
+        for batch in _batched(iter_csv_rows(results), _CSV_CHUNK_ROWS):
+            lines = []
+            for check_id, check_name, crash_id, issue, details in batch:
+                if (check_id, check_name, issue) != current:
+                    current = (check_id, check_name, issue)
+                    head = _csv_field(check_id) + "," + _csv_field(check_name) + ","
+                    issue_field = "," + _csv_field(issue) + ","
+                lines.append(
+                    head + _csv_field(crash_id) + issue_field
+                    + _csv_field(details) + _CSV_EOL
+                )
+            fh.write("".join(lines))
 
-    fieldnames = ["check_id", "check_name", "crash_id", "issue", "details"]
+    return path
 
-    with open(path, "w", encoding="utf-8-sig", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
 
-        all_results = []
-        for r in results:
-            all_results.append(r)
-            all_results.extend(r.sub_results)
-
-        for r in all_results:
-            if r.details is not None and len(r.details) > 0:
-                for _, row in r.details.iterrows():
-                    crash_id = row.get("Olycksnummer", row.get("crash_id", ""))
-                    # Build a details string from remaining columns
-                    detail_parts = []
-                    for col in r.details.columns:
-                        if col not in ("Olycksnummer", "crash_id"):
-                            detail_parts.append(f"{col}={row[col]}")
-                    writer.writerow({
-                        "check_id": r.check_id,
-                        "check_name": r.check_name,
-                        "crash_id": crash_id,
-                        "issue": r.summary,
-                        "details": "; ".join(detail_parts),
-                    })
-            elif r.issue_count > 0:
-                # Check had issues but no details DataFrame
-                writer.writerow({
-                    "check_id": r.check_id,
-                    "check_name": r.check_name,
-                    "crash_id": "",
-                    "issue": r.summary,
-                    "details": "",
-                })
+def iter_csv_rows(results: list[VerificationResult]) -> Iterator[tuple]:
+    """Lazily generate the rows of the CSV report.
 
-    return path
+    Yields one ``(check_id, check_name, crash_id, issue, details)`` tuple
+    (see ``CSV_REPORT_FIELDS``) per flagged record of each result and its
+    sub-results, plus one row without crash ID / details for results that
+    report issues but have no details table.  Details are converted to
+    strings one slice of rows at a time, so the rows can be streamed to any
+    consumer without materialising them all.
+
+    Parameters
+    ----------
+    results : list[VerificationResult]
+
+    Yields
+    ------
+    tuple
+    """
+    for r in (x for result in results for x in result.flat):
+        if r.has_details:
+            cols = r.details.columns.tolist()
+            # Backing array of each column, taken once; rows are sliced
+            # from these without going through the DataFrame
+            arrays = [r.details.iloc[:, i].array for i in range(len(cols))]
+            if "Olycksnummer" in cols:
+                id_array = arrays[cols.index("Olycksnummer")]
+            elif "crash_id" in cols:
+                id_array = arrays[cols.index("crash_id")]
+            else:
+                id_array = None
+            detail_arrays = [
+                (f"{col}=", array) for col, array in zip(cols, arrays)
+                if col not in ("Olycksnummer", "crash_id")
+            ]
+            for rows in _iter_slices(len(r.details)):
+                n_rows = rows.stop - rows.start
+                crash_ids = (
+                    id_array[rows].tolist()
+                    if id_array is not None
+                    else [""] * n_rows
+                )
+                # Details strings column by column: one list of
+                # "name=value" parts per remaining column, joined row-wise
+                parts = [
+                    _labelled(label, array[rows].tolist())
+                    for label, array in detail_arrays
+                ]
+                details_strs = (
+                    ["; ".join(row) for row in zip(*parts)]
+                    if parts
+                    else [""] * n_rows
+                )
+                for crash_id, details_str in zip(crash_ids, details_strs):
+                    yield (r.check_id, r.check_name, crash_id, r.summary, details_str)
+        elif r.issue_count > 0:
+            # Check had issues but no details DataFrame
+            yield (r.check_id, r.check_name, "", r.summary, "")
+
+
+def _batched(rows: Iterator[tuple], n: int) -> Iterator[list[tuple]]:
+    """Lists of up to *n* consecutive items of *rows*."""
+    rows = iter(rows)
+    while batch := list(islice(rows, n)):
+        yield batch
+
+
+def _csv_field(value: Any) -> str:
+    """Format one CSV field as ``csv.writer`` does with ``QUOTE_MINIMAL``.
+
+    ``None`` becomes an empty field; fields containing a comma, a quote or
+    a line break are quoted, with embedded quotes doubled.
+    """
+    if value is None:
+        return ""
+    text = str(value)
+    if "," in text or '"' in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _iter_slices(n_rows: int, n: int = _CSV_CHUNK_ROWS) -> Iterator[slice]:
+    """Consecutive slices covering *n_rows* rows, at most *n* rows each."""
+    for start in range(0, n_rows, n):
+        yield slice(start, min(start + n, n_rows))
+
+
+def _labelled(label: str, values: list) -> list[str]:
+    """``label + str(value)`` for each of *values*."""
+    return [label + value for value in map(str, values)]
@@ -0,0 +1,72 @@
+"""Tests for :mod:`strada.core.classify`."""
+
+from __future__ import annotations
+
+import csv
+
+from typer.testing import CliRunner
+
+from strada.cli import app
+from strada.config.constants import (
+    COL_AGE,
+    COL_CATEGORY_MAIN,
+    COL_CATEGORY_P,
+    COL_CATEGORY_S,
+    COL_CATEGORY_SUB,
+    COL_CRASH_ID,
+    COL_EVENT_P,
+    COL_EVENT_S,
+    COL_KONFLIKT_UG,
+    COL_ROLE_P,
+    COL_ROLE_S,
+    COL_TE_NR_P,
+)
+
+_PERSONS = [
+    ("Cykel", "Elcykel", "Förare", "Cyklade på elcykel och föll", "Personbil"),
+    ("Cykel", "Cykel - Annan", "Förare", "Körde elsparkcykel på trottoaren", ""),
+    ("Personbil", "Personbil", "Förare", "Svängde vänster", "Elcykel"),
+    ("Cykel", "Cykel", "Passagerare bak", "Satt på pakethållaren", ""),
+    ("Fotgängare", "Fotgängare", "Gående", "Gick över övergångsstället", "Cykel"),
+]
+
+
+def _write_personer(path, n_crashes: int = 8_000) -> None:
+    """A Personer CSV (over 1 MB) whose age column turns to text near the end."""
+    columns = [
+        COL_CRASH_ID, COL_AGE, COL_CATEGORY_MAIN, COL_CATEGORY_SUB,
+        COL_CATEGORY_P, COL_CATEGORY_S, COL_ROLE_P, COL_ROLE_S,
+        COL_EVENT_P, COL_EVENT_S, COL_TE_NR_P, COL_KONFLIKT_UG,
+    ]
+    rows = []
+    for crash in range(n_crashes):
+        for j in range(2):
+            main, sub, role, event, konflikt = _PERSONS[(crash + j) % len(_PERSONS)]
+            age = str(10 + (crash + j) % 70)
+            rows.append([
+                100_000 + crash, age, main, sub, sub, "", role, "",
+                f"{event} ({crash})", "", j + 1, konflikt,
+            ])
+    rows[-3][1] = "Okänd"
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def test_classify_chunked_matches_full_load(tmp_path):
+    personer = tmp_path / "Personer.csv"
+    _write_personer(personer)
+    assert personer.stat().st_size > 1 << 20
+
+    runner = CliRunner()
+    outputs = {}
+    for name, extra in (("full", []), ("chunked", ["--chunk-size", "1"])):
+        result = runner.invoke(app, [
+            "classify", "--personer", str(personer),
+            "--output-dir", str(tmp_path / name), *extra,
+        ])
+        assert result.exit_code == 0, result.output
+        outputs[name] = (tmp_path / name / "Personer-analysis-ready.csv").read_bytes()
+
+    assert outputs["chunked"] == outputs["full"]
@@ -0,0 +1,84 @@
+"""Tests for :mod:`strada.io.readers`."""
+
+from __future__ import annotations
+
+import io
+
+import pandas as pd
+import pytest
+
+from strada.io.readers import iter_csv, load_csv
+
+
+def _read_both(text: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Parse *text* with :func:`load_csv` and with ``pandas.read_csv``."""
+    return load_csv(io.BytesIO(text.encode())), pd.read_csv(io.StringIO(text))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# load_csv matches pandas.read_csv
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("a,a,a.1\n1,2,3\n", id="duplicate-header"),
+        pytest.param("a,b,c\nNone,<NA>,x\n1,y,\n", id="pandas-na-values"),
+        pytest.param("a,b\n", id="header-only"),
+        pytest.param("a\n18446744073709551615\n1\n", id="uint64"),
+        pytest.param("a\n9223372036854775808\n-1\n", id="beyond-int64"),
+        pytest.param("a\n1e20\n1\n", id="large-float"),
+        pytest.param("a,b\n2020-01-01,x\n,y\n", id="dates-as-text"),
+    ],
+)
+def test_load_csv_matches_read_csv(text):
+    got, expected = _read_both(text)
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_load_csv_keeps_integer_digits():
+    got, _ = _read_both("a\n18446744073709551615\n1\n")
+    assert got["a"].tolist() == [18446744073709551615, 1]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# iter_csv reads like load_csv
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _write_late_values(path, n_rows: int = 60_000) -> None:
+    """A CSV (over 1 MB) whose numeric-looking columns change type near the end."""
+    ages = [str(i % 90) for i in range(n_rows)]
+    counts = [str(i % 7) for i in range(n_rows)]
+    shares = [str(i % 5) for i in range(n_rows)]
+    ages[-3] = "Okänd"
+    counts[-3] = ""
+    shares[-3] = "0.5"
+    lines = ["Olycksnummer,Ålder,Antal,Andel,Text"]
+    lines += [
+        f"{i // 2},{age},{count},{share},rad {i}"
+        for i, (age, count, share) in enumerate(zip(ages, counts, shares))
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_iter_csv_late_text_in_numeric_column(tmp_path):
+    path = tmp_path / "Personer.csv"
+    _write_late_values(path)
+
+    chunks = list(iter_csv(path, 1))
+
+    assert len(chunks) > 1
+    full = load_csv(path)
+    assert full["Ålder"].iloc[-3] == "Okänd"
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+
+
+def test_load_csv_columns_none_present(tmp_path):
+    path = tmp_path / "Olyckor.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+
+    assert load_csv(path, columns=["b", "Nope"]).columns.tolist() == ["b"]
+    with pytest.raises(ValueError, match="None of the requested columns"):
+        load_csv(path, columns=["Nope"])
+    with pytest.raises(ValueError, match="None of the requested columns"):
+        next(iter_csv(path, 1, columns=["Nope"]))